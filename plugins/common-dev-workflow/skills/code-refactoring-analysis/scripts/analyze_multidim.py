@@ -6,12 +6,53 @@ Analyzes code across 5 dimensions: Maintainability, Performance, Security, Scala
 
 import argparse
 import ast
+import bisect
+import hashlib
 import importlib.util
 import json
+import mmap
+import multiprocessing
+import os
+import re
+import sqlite3
 import subprocess
 import sys
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
+
+# Optional in-process tool APIs; each falls back to its command-line tool when missing
+try:
+    from radon.cli import Config as RadonConfig
+    from radon.cli.harvest import CCHarvester, MIHarvester
+    from radon.cli.tools import cc_to_dict
+    from radon.complexity import SCORE as RADON_SCORE
+except ImportError:
+    CCHarvester = MIHarvester = None
+
+try:
+    from bandit.core import config as bandit_config, constants as bandit_constants, manager as bandit_manager
+except ImportError:
+    bandit_manager = None
+
+# orjson parses tool output (bandit's can be megabytes) several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Content hash for the facts cache; BLAKE3 hashes several times faster than SHA-256 without SHA-NI.
+# A digest from the other algorithm simply misses, so switching never serves stale facts
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
 
 # Check for required packages
 REQUIRED_PACKAGES = {
@@ -22,6 +63,53 @@ REQUIRED_PACKAGES = {
     'reusability': ['pylint']  # Uses similarity checker
 }
 
+# Rabin-Karp parameters for rolling block hashes in duplicate detection
+_HASH_BASE = 1_000_003
+_HASH_MOD = (1 << 61) - 1
+
+# Non-source directories, pruned from the project walk; the tests variant is matched
+# against project-relative paths
+_EXCLUDE_DIRS = r'venv|\.venv|__pycache__|node_modules|\.git|build|dist'
+_EXCLUDE_DIR_RE = re.compile(_EXCLUDE_DIRS)
+_EXCLUDE_WITH_TESTS_RE = re.compile(
+    rf'(?:^|[\\/])(?:{_EXCLUDE_DIRS}|tests?|test_[^\\/]*|[^\\/]*_test\.py)(?:[\\/]|$)'
+)
+
+# Raw-bytes prefilters: files that cannot contain a class / function are never parsed
+_CLASS_RE = re.compile(rb'^[ \t]*class\b', re.MULTILINE)
+_DEF_RE = re.compile(rb'^[ \t]*(?:async[ \t]+)?def\b', re.MULTILINE)
+
+# ast.PyCF_OPTIMIZED_AST (3.13+) folds constants so the trees we walk are smaller
+_PARSE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, 'PyCF_OPTIMIZED_AST', 0)
+
+# Node types that can contain statements; loops, imports and classes never occur inside expressions
+_STMT_TYPES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+# try/except and, from 3.11, try/except*: both hold body, handlers, orelse and finalbody
+_TRY_TYPES = (ast.Try,) + ((ast.TryStar,) if hasattr(ast, 'TryStar') else ())
+
+# match statements (3.10+); an empty tuple never matches isinstance on older interpreters
+_MATCH_TYPES = (ast.Match,) if hasattr(ast, 'Match') else ()
+
+# Below this many files, process-pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Process pools start while the external-tool threads are running, and forking a process with live
+# threads can hand a child a lock some other thread held; start workers from a clean process instead
+_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Files per bandit run: bounds the JSON held in memory at once on large projects
+_BANDIT_BATCH_SIZE = 500
+
+# Directory names pylint skips, matching the files the other reusability checks cover
+_PYLINT_IGNORE = 'CVS,venv,.venv,__pycache__,node_modules,.git,build,dist,test,tests'
+
+# Per-file facts cache, shared directory with analyze_python.py; bump when _FileFacts or how it is computed changes
+_CACHE_DB = Path('.refactoring-cache') / 'multidim.sqlite'
+_FACTS_CACHE_VERSION = 4
+
 def check_package_installed(package: str) -> bool:
     """Check if a Python package is installed"""
     spec = importlib.util.find_spec(package.replace('-', '_'))
@@ -46,14 +134,413 @@ def check_dependencies(dimensions: List[str]) -> Dict[str, bool]:
     return available
 
 
+def _score(value: float, cutoffs: tuple = (5, 10, 15), scores: tuple = (100, 80, 60, 40)) -> int:
+    """Threshold ladder as a lookup: value <= cutoffs[i] scores scores[i], anything above the last scores[-1]"""
+    return scores[bisect.bisect_left(cutoffs, value)]
+
+
+def _parse(source, filename: str) -> ast.AST:
+    """Single parse entry point: AST only, optimized (constant-folded) on Python 3.13+"""
+    return compile(source, filename, 'exec', flags=_PARSE_FLAGS, optimize=2)
+
+
+def _parse_if_contains(py_file: Path, marker: 're.Pattern[bytes]') -> Optional[ast.AST]:
+    """Parse a file only if its raw bytes match marker; None means it cannot produce findings"""
+    content = py_file.read_bytes()
+    if not marker.search(content):
+        return None
+    return _parse(content, str(py_file))
+
+
+def _map_file(py_file: Path):
+    """Read-only view of a file's bytes without copying them (empty files cannot be mapped)"""
+    with open(py_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _walk_statements(node: ast.AST):
+    """Yield node and the statements beneath it in ast.walk order, without visiting any expression nodes.
+
+    Statements only nest inside statements, so a breadth-first walk over statement
+    children reaches every statement at the same position ast.walk would.
+    """
+    pending = deque([node])
+    while pending:
+        node = pending.popleft()
+        yield node
+        pending.extend(child for child in ast.iter_child_nodes(node) if isinstance(child, _STMT_TYPES))
+
+
+def _iter_class_defs(tree: ast.AST):
+    """Yield ClassDef nodes in ast.walk order, without visiting any expression nodes"""
+    return (node for node in _walk_statements(tree) if isinstance(node, ast.ClassDef))
+
+
+def _iter_direct_calls(body: List[ast.stmt]):
+    """Yield statement-level calls: `Foo()`, `x = Foo()`, `self.x: T = Foo()`.
+
+    Descends only into control-flow blocks, never into nested defs, lambdas or
+    comprehensions, so an __init__ with real logic is not walked exhaustively.
+    """
+    stack = list(reversed(body))
+    while stack:
+        stmt = stack.pop()
+        if isinstance(stmt, (ast.Expr, ast.Assign, ast.AnnAssign)):
+            if isinstance(stmt.value, ast.Call):
+                yield stmt.value
+        elif isinstance(stmt, (ast.If, ast.For, ast.AsyncFor, ast.While)):
+            stack.extend(reversed(stmt.orelse))
+            stack.extend(reversed(stmt.body))
+        elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+            stack.extend(reversed(stmt.body))
+        elif isinstance(stmt, _TRY_TYPES):
+            stack.extend(reversed(stmt.finalbody))
+            stack.extend(reversed(stmt.orelse))
+            for handler in reversed(stmt.handlers):
+                stack.extend(reversed(handler.body))
+            stack.extend(reversed(stmt.body))
+        elif isinstance(stmt, _MATCH_TYPES):
+            for case in reversed(stmt.cases):
+                stack.extend(reversed(case.body))
+
+
+class _Finding:
+    """Base for slotted finding records; converted to report dicts once at the end"""
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        # 'class' is a keyword, so records store it as class_name
+        return {('class' if key == 'class_name' else key): value for key, value in asdict(self).items()}
+
+
+@dataclass(slots=True, frozen=True)
+class GodClassFinding(_Finding):
+    """Class with too many methods or lines (SRP violation)"""
+    file: str
+    class_name: str
+    line: int
+    method_count: int
+    class_lines: int
+    violation: str
+    message: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class CouplingFinding(_Finding):
+    """Class instantiating many concrete dependencies in __init__"""
+    file: str
+    class_name: str
+    line: int
+    instantiations: int
+    message: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class OcpFinding(_Finding):
+    """Function with a long if-elif chain (OCP violation)"""
+    file: str
+    function: str
+    line: int
+    elif_count: int
+    violation: str
+    message: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class DipFinding(_Finding):
+    """Class with concrete class-level dependencies (DIP violation)"""
+    file: str
+    class_name: str
+    line: int
+    concrete_deps: List[str]
+    violation: str
+    message: str
+    severity: str
+
+
+@dataclass(slots=True)
+class _FileFacts:
+    """Per-file results shared by the performance and scalability dimensions (one parse per file)"""
+    relative_path: str
+    nested_loops: List[Dict]
+    sync_operations: List[Dict]
+    memory_risks: List[Dict]
+    inefficient_patterns: List[Dict]
+    imports: List[str]
+    god_classes: List[GodClassFinding]
+
+
+class _UnifiedVisitor(ast.NodeVisitor):
+    """Collects nested loops, imports and god classes in a single traversal of a module"""
+
+    def __init__(self, relative_path: str):
+        self.relative_path = relative_path
+        self.nested_loops: List[Dict] = []
+        self.imports: List[str] = []
+        self.god_classes: List[GodClassFinding] = []
+        # Enclosing loops, innermost last, and whether each has already been reported
+        self._loops: List[list] = []
+        self._handlers: Dict[type, Any] = {}
+
+    def visit(self, node: ast.AST):
+        # Resolve the visit_* handler once per node type instead of a getattr per node
+        handler = self._handlers.get(type(node))
+        if handler is None:
+            handler = getattr(self, 'visit_' + type(node).__name__, self.generic_visit)
+            self._handlers[type(node)] = handler
+        return handler(node)
+
+    def generic_visit(self, node: ast.AST):
+        """Descend into statements only; expression subtrees cannot hold anything we collect"""
+        visit = self.visit
+        stmt_types = _STMT_TYPES
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, stmt_types):
+                visit(child)
+
+    def visit_For(self, node: ast.AST):
+        if self._loops:
+            # The innermost enclosing loop has a loop inside it: potential O(n²)
+            enclosing = self._loops[-1]
+            if not enclosing[1]:
+                enclosing[1] = True
+                self.nested_loops.append({
+                    'file': self.relative_path,
+                    'line': enclosing[0].lineno,
+                    'type': 'nested_loop',
+                    'message': 'Nested loop detected - potential O(n²) complexity',
+                    'severity': 'medium'
+                })
+        self._loops.append([node, False])
+        self.generic_visit(node)
+        self._loops.pop()
+
+    visit_While = visit_For
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.imports.append(node.module)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        # Count methods directly from the class body
+        method_count = sum(1 for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)))
+
+        # Count class lines
+        class_lines = node.end_lineno - node.lineno + 1 if hasattr(node, 'end_lineno') else 0
+
+        if method_count > 20 or class_lines > 500:
+            self.god_classes.append(GodClassFinding(
+                file=self.relative_path,
+                class_name=node.name,
+                line=node.lineno,
+                method_count=method_count,
+                class_lines=class_lines,
+                violation='Single Responsibility Principle',
+                message=f'Class has {method_count} methods and {class_lines} lines - consider splitting',
+                severity='medium'
+            ))
+
+        self.generic_visit(node)
+
+
+def _facts_to_json(facts: Optional[_FileFacts]) -> str:
+    """Cache form of a file's facts; plain JSON, since the cache lives inside the analyzed project"""
+    return json.dumps(None if facts is None else asdict(facts))
+
+
+def _facts_from_json(data) -> Optional[_FileFacts]:
+    """Rebuild facts stored by _facts_to_json; raises ValueError/TypeError on malformed entries"""
+    fields = _json_loads(data)
+    if fields is None:
+        return None
+    facts = _FileFacts(**fields)
+    facts.god_classes = [GodClassFinding(**finding) for finding in facts.god_classes]
+    return facts
+
+
+def _parse_and_analyze(py_file: Path, source: bytes, project_root: Path, dimensions: List[str]) -> Optional[_FileFacts]:
+    """Analyze one file; module-level so ProcessPoolExecutor workers can pickle it"""
+    return MultiDimensionalAnalyzer(str(project_root), dimensions, use_cache=False)._analyze_source_file(py_file, source)
+
+
+class _AnalysisCache:
+    """SQLite store of per-file analysis results from earlier runs.
+
+    `facts` holds JSON-encoded _FileFacts checked against a content hash; `tool_results` holds each
+    external tool's per-file output, which --since merges with results for the changed files.
+    Best effort: any database error disables the cache for the run instead of failing the analysis.
+    """
+
+    def __init__(self, db_path: Path):
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path))
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS facts ('
+                'path TEXT, variant TEXT, sha BLOB, facts BLOB, PRIMARY KEY (path, variant))'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS tool_results ('
+                'tool TEXT, path TEXT, data BLOB, PRIMARY KEY (tool, path))'
+            )
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def load(self, variant: str) -> Dict[str, tuple]:
+        """All facts entries for a variant as {path: (sha, JSON facts)}, in one query.
+
+        The variant covers the cache version and which dimensions' facts were computed.
+        """
+        if self._conn is None:
+            return {}
+        try:
+            rows = self._conn.execute('SELECT path, sha, facts FROM facts WHERE variant = ?', (variant,))
+            return {path: (sha, blob) for path, sha, blob in rows}
+        except sqlite3.Error:
+            return {}
+
+    def store(self, variant: str, entries: List[tuple]):
+        """Upsert (path, sha, JSON facts) rows; one row per path, so stale versions don't accumulate"""
+        if self._conn is None or not entries:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO facts (path, variant, sha, facts) VALUES (?, ?, ?, ?)',
+                    [(path, variant, sha, blob) for path, sha, blob in entries]
+                )
+        except sqlite3.Error:
+            pass
+
+    def load_tool(self, tool: str) -> Dict[str, Any]:
+        """A tool's stored per-file output as {path as the tool reports it: data}"""
+        if self._conn is None:
+            return {}
+        try:
+            rows = self._conn.execute('SELECT path, data FROM tool_results WHERE tool = ?', (tool,))
+            return {path: _json_loads(data) for path, data in rows}
+        except (sqlite3.Error, ValueError):
+            # Unreadable rows (e.g. written by an older format) just mean no baseline: the tool runs in full
+            return {}
+
+    def replace_tool(self, tool: str, results: Dict[str, Any]):
+        """Make results the stored per-file output of a tool"""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.execute('DELETE FROM tool_results WHERE tool = ?', (tool,))
+                self._conn.executemany(
+                    'INSERT INTO tool_results (tool, path, data) VALUES (?, ?, ?)',
+                    [(tool, path, json.dumps(data)) for path, data in results.items()]
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+
+
+def _git_changed_files(project_path: Path, ref: str) -> Optional[set]:
+    """Project-relative .py paths that differ from a git ref, including uncommitted and untracked files.
+
+    None when git fails (not a repository, unknown ref, git missing).
+    """
+    try:
+        diff = subprocess.run(
+            ['git', '-C', str(project_path), 'diff', '--name-only', '--relative', ref, '--', '*.py'],
+            capture_output=True, text=True, timeout=30, check=True
+        )
+        untracked = subprocess.run(
+            ['git', '-C', str(project_path), 'ls-files', '--others', '--exclude-standard', '--', '*.py'],
+            capture_output=True, text=True, timeout=30, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return {str(Path(name)) for name in (diff.stdout + untracked.stdout).splitlines()}
+
+
+def _hash_blocks(path: Path, project_root: Path, block_size: int = 5) -> List[tuple]:
+    """Return ((hash, length), relative_path, line) for every non-trivial block in a file.
+
+    Top-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    relative_path = str(path.relative_to(project_root))
+    blocks = []
+
+    # A block is compared by the space-joined text of its non-empty lines, so blank lines take no
+    # part in the hash; the oldest non-empty line leaves with weight P^(non_empty - 1) mod M
+    weights = [pow(_HASH_BASE, k, _HASH_MOD) for k in range(block_size)]
+    # (line_hash, normalized_length) for the lines of the current block only
+    window = deque(maxlen=block_size)
+    h = 0
+    text_len = 0
+    non_empty = 0
+
+    try:
+        # Stream line by line; memory stays O(block_size) instead of O(file). An undecodable byte
+        # only changes its own line
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for lineno, line in enumerate(f, 1):
+                normalized = ' '.join(line.split())
+                line_hash = zlib.crc32(normalized.encode('utf-8'))
+                line_len = len(normalized)
+
+                # Check blocks of 5+ lines; each slide costs O(1)
+                if len(window) == block_size:
+                    leaving_hash, leaving_len = window[0]
+                    if leaving_len:
+                        h = (h - leaving_hash * weights[non_empty - 1]) % _HASH_MOD
+                        text_len -= leaving_len
+                        non_empty -= 1
+                window.append((line_hash, line_len))
+                if line_len:
+                    h = (h * _HASH_BASE + line_hash) % _HASH_MOD
+                    text_len += line_len
+                    non_empty += 1
+
+                if len(window) < block_size:
+                    continue
+
+                # Length of the space-joined block, as the old normalization produced
+                combined_len = text_len + max(non_empty - 1, 0)
+
+                # Skip empty or trivial blocks
+                if combined_len < 50:
+                    continue
+
+                blocks.append(((h, combined_len), relative_path, lineno - block_size + 1))
+    except Exception:
+        return []
+
+    return blocks
+
+
 class MultiDimensionalAnalyzer:
     """Analyzes Python code across multiple dimensions"""
 
     VERSION = "1.1.0"
 
-    def __init__(self, project_path: str, dimensions: List[str]):
+    def __init__(self, project_path: str, dimensions: List[str], use_pylint: bool = False, use_cache: bool = True,
+                 since: Optional[str] = None):
         self.project_path = Path(project_path)
+        # Passed to every tool run; stringified once
+        self._project_str = os.fspath(self.project_path)
         self.dimensions = dimensions
+        self.use_pylint = use_pylint
+        self.use_cache = use_cache
+        # --since: only files changed relative to this git ref are re-analyzed; the rest come from the cache
+        self.since = since if use_cache else None
         self.tools_used = []
         self.tools_failed = []
         self.files_analyzed = 0
@@ -71,6 +558,134 @@ class MultiDimensionalAnalyzer:
             'overall_health': 0,
             'priority_actions': []
         }
+        self._relative_paths: Dict[Path, str] = {}
+        self._file_facts: Optional[List[_FileFacts]] = None
+        self._py_files: Optional[List[Path]] = None
+        self._tool_futures: Dict[str, Future] = {}
+        self._changed: Optional[set] = None
+
+    def _relative_path(self, py_file: Path) -> str:
+        """Project-relative path string, computed once per file across all dimensions"""
+        relative_path = self._relative_paths.get(py_file)
+        if relative_path is None:
+            relative_path = str(py_file.relative_to(self.project_path))
+            self._relative_paths[py_file] = relative_path
+        return relative_path
+
+    def _python_files(self, include_tests: bool = True) -> List[Path]:
+        """Project .py files outside non-source directories, found by a single cached os.walk"""
+        if self._py_files is None:
+            # Built locally and published whole: the bandit run may ask for it from its tool thread
+            py_files = []
+            for root, dirs, files in os.walk(self.project_path):
+                # Prune in place so excluded directories are never descended into
+                dirs[:] = [d for d in dirs if not _EXCLUDE_DIR_RE.fullmatch(d)]
+                py_files.extend(Path(root, name) for name in files if name.endswith('.py'))
+            self._py_files = py_files
+
+        if include_tests:
+            return self._py_files
+        return [f for f in self._py_files if not _EXCLUDE_WITH_TESTS_RE.search(self._relative_path(f))]
+
+    def _collect_file_facts(self) -> List[_FileFacts]:
+        """Walk and parse the project's source files once, shared by performance and scalability"""
+        if self._file_facts is None:
+            self._file_facts = self._load_file_facts()
+        return self._file_facts
+
+    def _load_file_facts(self) -> List[_FileFacts]:
+        """Facts for every project file: cached where still valid, freshly parsed otherwise"""
+        python_files = self._python_files()
+
+        cache = None
+        cached = {}
+        if self.use_cache:
+            computed = '+'.join(d for d in ('performance', 'scalability') if d in self.dimensions)
+            variant = f'v{_FACTS_CACHE_VERSION}:{computed}'
+            cache = _AnalysisCache(self.project_path / _CACHE_DB)
+            cached = cache.load(variant)
+
+        # Unchanged files (same content hash) reuse their stored facts; only the rest are parsed
+        facts: List[Optional[_FileFacts]] = [None] * len(python_files)
+        pending = []
+        # Every file is hashed, even under --since: git's view of "unchanged" does not cover
+        # edits the cache missed (e.g. a run with a different ref or a checkout in between)
+        for index, py_file in enumerate(python_files):
+            try:
+                view = _map_file(py_file)
+            except (OSError, ValueError):
+                continue
+            try:
+                # Hash straight from the mapping; only files that must be re-parsed are copied into bytes
+                digest = _hasher(view).digest()
+                entry = cached.get(self._relative_path(py_file))
+                if entry is not None and entry[0] == digest:
+                    try:
+                        facts[index] = _facts_from_json(entry[1])
+                        continue
+                    except (ValueError, TypeError):
+                        # Malformed entry: re-parse the file and overwrite it
+                        pass
+                pending.append((index, view[:], digest))
+            finally:
+                if isinstance(view, mmap.mmap):
+                    view.close()
+
+        # Parsing is independent per file, so fan it out across processes on larger projects
+        pending_files = [python_files[index] for index, _, _ in pending]
+        pending_sources = [source for _, source, _ in pending]
+        if len(pending) >= _PARALLEL_MIN_FILES:
+            project_roots = [self.project_path] * len(pending)
+            dimensions = [self.dimensions] * len(pending)
+            with ProcessPoolExecutor(mp_context=_POOL_CONTEXT) as executor:
+                parsed = list(executor.map(
+                    _parse_and_analyze, pending_files, pending_sources, project_roots, dimensions, chunksize=16
+                ))
+        else:
+            parsed = list(map(self._analyze_source_file, pending_files, pending_sources))
+
+        for (index, _, _), file_facts in zip(pending, parsed):
+            facts[index] = file_facts
+
+        if cache is not None:
+            # Failures are cached too (as None) so a broken file is not re-parsed every run
+            cache.store(variant, [
+                (self._relative_path(py_file), digest, _facts_to_json(file_facts))
+                for py_file, (_, _, digest), file_facts in zip(pending_files, pending, parsed)
+            ])
+            cache.close()
+
+        # Files that fail to read or parse are skipped, as before
+        return [file_facts for file_facts in facts if file_facts is not None]
+
+    def _analyze_source_file(self, py_file: Path, source: bytes) -> Optional[_FileFacts]:
+        """Parse one file's source, then run every per-file check the requested dimensions need"""
+        try:
+            # Parse the bytes as-is; compile() handles coding declarations without a separate decode
+            tree = _parse(source, str(py_file))
+            # The regex checks still need text: decoded per the file's declared encoding, universal newlines
+            content = importlib.util.decode_source(source)
+
+            facts = _FileFacts(self._relative_path(py_file), [], [], [], [], [], [])
+
+            # Nested loops, imports and god classes in one traversal
+            visitor = _UnifiedVisitor(facts.relative_path)
+            visitor.visit(tree)
+
+            if 'performance' in self.dimensions:
+                facts.nested_loops = visitor.nested_loops
+                facts.sync_operations = self._find_sync_operations(content, facts.relative_path)
+                facts.memory_risks = self._find_memory_risks(tree, content, facts.relative_path)
+                facts.inefficient_patterns = self._find_inefficient_patterns(tree, content, facts.relative_path)
+
+            if 'scalability' in self.dimensions:
+                facts.imports = visitor.imports
+                facts.god_classes = visitor.god_classes
+
+            return facts
+
+        except Exception:
+            return None
 
     def _track_tool(self, tool_name: str, success: bool, reason: str = None):
         """Track tool usage for meta output"""
@@ -83,14 +698,19 @@ class MultiDimensionalAnalyzer:
 
     def _finalize_meta(self):
         """Update meta section with final tracking data"""
-        self.results['meta']['tools_used'] = self.tools_used
-        self.results['meta']['tools_failed'] = [t['tool'] for t in self.tools_failed]
+        expected_tools = ['radon', 'bandit', 'pylint', 'pydeps']
+
+        # Tools are recorded as their results are consumed; list them in a fixed order so reports stay comparable
+        def tool_order(tool_name: str) -> int:
+            return expected_tools.index(tool_name) if tool_name in expected_tools else len(expected_tools)
+
+        self.results['meta']['tools_used'] = sorted(self.tools_used, key=tool_order)
+        self.results['meta']['tools_failed'] = sorted((t['tool'] for t in self.tools_failed), key=tool_order)
         self.results['meta']['coverage'] = {
             'files_analyzed': self.files_analyzed,
             'files_skipped': self.files_skipped
         }
         # Calculate confidence based on tool availability
-        expected_tools = ['radon', 'bandit', 'pylint', 'pydeps']
         available_count = len([t for t in expected_tools if t in self.tools_used])
         failed_count = len(self.tools_failed)
         self.results['meta']['confidence'] = round(
@@ -100,21 +720,25 @@ class MultiDimensionalAnalyzer:
     def analyze(self) -> Dict[str, Any]:
         """Run analysis for all requested dimensions"""
         print(f"\n🔍 Analyzing {self.project_path} across {len(self.dimensions)} dimensions...\n")
-        
-        if 'maintainability' in self.dimensions:
-            self.results['dimensions']['maintainability'] = self.analyze_maintainability()
-        
-        if 'performance' in self.dimensions:
-            self.results['dimensions']['performance'] = self.analyze_performance()
-        
-        if 'security' in self.dimensions:
-            self.results['dimensions']['security'] = self.analyze_security()
-        
-        if 'scalability' in self.dimensions:
-            self.results['dimensions']['scalability'] = self.analyze_scalability()
-        
-        if 'reusability' in self.dimensions:
-            self.results['dimensions']['reusability'] = self.analyze_reusability()
+
+        if self.since is not None:
+            self._changed = _git_changed_files(self.project_path, self.since)
+            if self._changed is None:
+                print(f"  Warning: could not diff against '{self.since}' - analyzing every file")
+            else:
+                print(f"  Re-analyzing {len(self._changed)} Python file(s) changed since {self.since}\n")
+
+        # External tools are independent of each other and of the AST checks: start them all
+        # up front so their wall time overlaps instead of adding up
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            self._start_tools(executor)
+
+            # Dimensions run one at a time on this thread, in report order
+            for dimension, handler in self._dimension_handlers().items():
+                if dimension in self.dimensions:
+                    self.results['dimensions'][dimension] = handler()
+
+            self._tool_futures = {}
         
         # Calculate overall health
         self._calculate_overall_health()
@@ -127,6 +751,78 @@ class MultiDimensionalAnalyzer:
 
         return self.results
     
+    def _dimension_handlers(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """Analysis entry point for every supported dimension, in report order"""
+        return {
+            'maintainability': self.analyze_maintainability,
+            'performance': self.analyze_performance,
+            'security': self.analyze_security,
+            'scalability': self.analyze_scalability,
+            'reusability': self.analyze_reusability,
+        }
+
+    def _start_tools(self, executor: ThreadPoolExecutor):
+        """Submit every external tool run the requested dimensions will need"""
+        names = []
+        if 'maintainability' in self.dimensions:
+            names += ['radon_cc', 'radon_mi']
+        if 'security' in self.dimensions:
+            names += ['bandit', 'safety']
+        if 'reusability' in self.dimensions and self.use_pylint:
+            names.append('pylint')
+
+        runs = self._tool_runs()
+        self._tool_futures = {name: executor.submit(runs[name]) for name in names}
+
+    def _tool_runs(self) -> Dict[str, Callable[[], Any]]:
+        """Zero-argument runners for every external tool, keyed by name"""
+        return {
+            'radon_cc': partial(self._per_file_tool, 'radon_cc', self._radon_complexity),
+            'radon_mi': partial(self._per_file_tool, 'radon_mi', self._radon_maintainability),
+            'bandit': partial(self._per_file_tool, 'bandit', self._bandit_by_file),
+            # Project-wide checks: no per-file results to merge, so they always run in full
+            'safety': self._safety_results,
+            'pylint': self._pylint_results,
+        }
+
+    def _tool_result(self, name: str):
+        """Result of a tool started by analyze(), or run it now when called standalone.
+
+        Exceptions raised by the tool surface here, in the dimension that handles them.
+        """
+        future = self._tool_futures.get(name)
+        return future.result() if future is not None else self._tool_runs()[name]()
+
+    def _per_file_tool(self, tool: str, run: Callable[[List[str]], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Run a tool whose output is keyed by file, storing the output for later --since runs.
+
+        With --since and a stored baseline, only the changed files are passed to the tool and
+        its fresh results replace theirs in the baseline; everything else is reused as stored.
+        """
+        cache = _AnalysisCache(self.project_path / _CACHE_DB) if self.use_cache else None
+        try:
+            stored = cache.load_tool(tool) if cache is not None and self._changed is not None else {}
+            if stored:
+                changed = {str(self.project_path / path) for path in self._changed}
+                # Deleted files have no fresh results; dropping their stored entries is enough
+                targets = sorted(path for path in changed if os.path.isfile(path))
+                fresh = run(targets) if targets else {}
+                if fresh is None:
+                    return None
+                results = {path: data for path, data in stored.items() if path not in changed}
+                results.update(fresh)
+            else:
+                results = run([self._project_str])
+                if results is None:
+                    return None
+
+            if cache is not None:
+                cache.replace_tool(tool, results)
+            return results
+        finally:
+            if cache is not None:
+                cache.close()
+
     def analyze_maintainability(self) -> Dict[str, Any]:
         """Analyze maintainability dimension"""
         print("🔧 Analyzing Maintainability...")
@@ -140,16 +836,10 @@ class MultiDimensionalAnalyzer:
         
         # Run Radon for complexity
         try:
-            radon_output = subprocess.run(
-                ['radon', 'cc', str(self.project_path), '-a', '--json'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if radon_output.returncode == 0:
+            complexity_data = self._tool_result('radon_cc')
+
+            if complexity_data is not None:
                 self._track_tool('radon', True)
-                complexity_data = json.loads(radon_output.stdout)
 
                 # Calculate average complexity
                 total_complexity = 0
@@ -157,6 +847,9 @@ class MultiDimensionalAnalyzer:
                 high_complexity = []
 
                 for file, functions in complexity_data.items():
+                    # Files radon could not parse are reported as {"error": ...}
+                    if not isinstance(functions, list):
+                        continue
                     self.files_analyzed += 1
                     for func in functions:
                         total_complexity += func.get('complexity', 0)
@@ -176,14 +869,7 @@ class MultiDimensionalAnalyzer:
                 result['issues'].extend(high_complexity)
 
                 # Score based on complexity
-                if avg_complexity <= 5:
-                    result['score'] = 100
-                elif avg_complexity <= 10:
-                    result['score'] = 80
-                elif avg_complexity <= 15:
-                    result['score'] = 60
-                else:
-                    result['score'] = 40
+                result['score'] = _score(avg_complexity)
             else:
                 self._track_tool('radon', False, 'non-zero exit code')
 
@@ -193,16 +879,9 @@ class MultiDimensionalAnalyzer:
         
         # Run Radon for maintainability index
         try:
-            radon_mi = subprocess.run(
-                ['radon', 'mi', str(self.project_path), '--json'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if radon_mi.returncode == 0:
-                mi_data = json.loads(radon_mi.stdout)
-                
+            mi_data = self._tool_result('radon_mi')
+
+            if mi_data is not None:
                 mi_scores = []
                 for file, data in mi_data.items():
                     mi_scores.append(data.get('mi', 0))
@@ -216,6 +895,45 @@ class MultiDimensionalAnalyzer:
         print(f"  ✓ Maintainability score: {result['score']}/100")
         return result
     
+    def _radon_complexity(self, targets: List[str]) -> Optional[Dict[str, Any]]:
+        """`radon cc --json` data for the targets, in-process when radon is importable; None on failure"""
+        if CCHarvester is not None:
+            config = RadonConfig(
+                min='A', max='F', exclude=None, ignore=None, show_complexity=False,
+                average=True, total_average=False, order=RADON_SCORE, no_assert=False,
+                show_closures=False, include_ipynb=False, ipynb_cells=False
+            )
+            harvester = CCHarvester(targets, config)
+            # Same shape as the CLI's JSON: files without any blocks are omitted
+            return {
+                name: blocks if isinstance(blocks, dict) else [cc_to_dict(block) for block in blocks]
+                for name, blocks in harvester.results if blocks
+            }
+
+        # stdout stays bytes: the JSON parser takes them directly, skipping a decode and a str copy
+        radon_output = subprocess.run(
+            ['radon', 'cc', *targets, '-a', '--json'],
+            capture_output=True,
+            timeout=30
+        )
+        return _json_loads(radon_output.stdout) if radon_output.returncode == 0 else None
+
+    def _radon_maintainability(self, targets: List[str]) -> Optional[Dict[str, Any]]:
+        """`radon mi --json` data for the targets, in-process when radon is importable; None on failure"""
+        if MIHarvester is not None:
+            config = RadonConfig(
+                min='A', max='C', exclude=None, ignore=None, multi=True, show=False,
+                sort=False, include_ipynb=False, ipynb_cells=False
+            )
+            return dict(MIHarvester(targets, config).results)
+
+        radon_mi = subprocess.run(
+            ['radon', 'mi', *targets, '--json'],
+            capture_output=True,
+            timeout=30
+        )
+        return _json_loads(radon_mi.stdout) if radon_mi.returncode == 0 else None
+
     def analyze_performance(self) -> Dict[str, Any]:
         """Analyze performance dimension"""
         print("⚡ Analyzing Performance...")
@@ -233,42 +951,22 @@ class MultiDimensionalAnalyzer:
             }
         }
 
-        python_files = list(self.project_path.rglob('*.py'))
-        # Skip common non-source directories
-        python_files = [f for f in python_files if not any(
-            part in str(f) for part in ['venv', '.venv', '__pycache__', 'node_modules', '.git', 'build', 'dist']
-        )]
-
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
+        for facts in self._collect_file_facts():
+            # Nested loops (O(n²) complexity)
+            result['algorithmic_issues'].extend(facts.nested_loops)
+            result['metrics']['nested_loops'] += len(facts.nested_loops)
 
-                relative_path = str(py_file.relative_to(self.project_path))
+            # Synchronous blocking operations
+            result['bottlenecks'].extend(facts.sync_operations)
+            result['metrics']['sync_operations'] += len(facts.sync_operations)
 
-                # Nested loops (O(n²) complexity)
-                nested_loops = self._find_nested_loops(tree, relative_path)
-                result['algorithmic_issues'].extend(nested_loops)
-                result['metrics']['nested_loops'] += len(nested_loops)
+            # Memory risk patterns
+            result['bottlenecks'].extend(facts.memory_risks)
+            result['metrics']['memory_risks'] += len(facts.memory_risks)
 
-                # Synchronous blocking operations
-                sync_issues = self._find_sync_operations(content, relative_path)
-                result['bottlenecks'].extend(sync_issues)
-                result['metrics']['sync_operations'] += len(sync_issues)
-
-                # Memory risk patterns
-                memory_issues = self._find_memory_risks(tree, content, relative_path)
-                result['bottlenecks'].extend(memory_issues)
-                result['metrics']['memory_risks'] += len(memory_issues)
-
-                # Inefficient patterns
-                inefficient = self._find_inefficient_patterns(tree, content, relative_path)
-                result['algorithmic_issues'].extend(inefficient)
-                result['metrics']['inefficient_patterns'] += len(inefficient)
-
-            except Exception:
-                continue
+            # Inefficient patterns
+            result['algorithmic_issues'].extend(facts.inefficient_patterns)
+            result['metrics']['inefficient_patterns'] += len(facts.inefficient_patterns)
 
         # Calculate score
         total_issues = (
@@ -276,13 +974,13 @@ class MultiDimensionalAnalyzer:
             len(result['bottlenecks'])
         )
 
-        # Severity-based scoring
-        high_severity = sum(1 for i in result['algorithmic_issues'] + result['bottlenecks']
-                          if i.get('severity') == 'high')
-        medium_severity = sum(1 for i in result['algorithmic_issues'] + result['bottlenecks']
-                             if i.get('severity') == 'medium')
-        low_severity = sum(1 for i in result['algorithmic_issues'] + result['bottlenecks']
-                          if i.get('severity') == 'low')
+        # Severity-based scoring, counted in one pass without concatenating the two lists
+        severity_counts = Counter(
+            i.get('severity') for issues in (result['algorithmic_issues'], result['bottlenecks']) for i in issues
+        )
+        high_severity = severity_counts['high']
+        medium_severity = severity_counts['medium']
+        low_severity = severity_counts['low']
 
         penalty = (high_severity * 8) + (medium_severity * 3) + (low_severity * 1)
         result['score'] = max(20, 100 - penalty)
@@ -295,26 +993,6 @@ class MultiDimensionalAnalyzer:
 
         return result
 
-    def _find_nested_loops(self, tree: ast.AST, filename: str) -> List[Dict]:
-        """Find nested loops that may indicate O(n²) complexity"""
-        issues = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.For, ast.While)):
-                # Check if there's a nested loop
-                for child in ast.walk(node):
-                    if child != node and isinstance(child, (ast.For, ast.While)):
-                        issues.append({
-                            'file': filename,
-                            'line': node.lineno,
-                            'type': 'nested_loop',
-                            'message': 'Nested loop detected - potential O(n²) complexity',
-                            'severity': 'medium'
-                        })
-                        break
-
-        return issues
-
     def _find_sync_operations(self, content: str, filename: str) -> List[Dict]:
         """Find synchronous blocking operations"""
         import re
@@ -391,9 +1069,10 @@ class MultiDimensionalAnalyzer:
         issues = []
 
         # String concatenation in loop
-        for node in ast.walk(tree):
+        # Loops and augmented assignments are statements: skip every expression subtree
+        for node in _walk_statements(tree):
             if isinstance(node, (ast.For, ast.While)):
-                for child in ast.walk(node):
+                for child in _walk_statements(node):
                     if isinstance(child, ast.AugAssign) and isinstance(child.op, ast.Add):
                         if isinstance(child.target, ast.Name):
                             issues.append({
@@ -457,19 +1136,13 @@ class MultiDimensionalAnalyzer:
 
         # Run Bandit for security issues
         try:
-            bandit_output = subprocess.run(
-                ['bandit', '-r', str(self.project_path), '-f', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            bandit_by_file = self._tool_result('bandit')
 
-            # Bandit returns non-zero when it finds issues
-            if bandit_output.stdout:
+            if bandit_by_file is not None:
                 self._track_tool('bandit', True)
-                bandit_data = json.loads(bandit_output.stdout)
 
-                vulnerabilities = bandit_data.get('results', [])
+                vulnerabilities = [v for file_results in bandit_by_file.values() for v in file_results]
+
                 result['vulnerabilities'] = [
                     {
                         'file': v.get('filename'),
@@ -494,17 +1167,14 @@ class MultiDimensionalAnalyzer:
             print(f"  Warning: Bandit analysis failed - {e}")
 
         # Always run static security pattern analysis (supplements Bandit)
-        python_files = list(self.project_path.rglob('*.py'))
-        python_files = [f for f in python_files if not any(
-            part in str(f) for part in ['venv', '.venv', '__pycache__', 'node_modules', '.git', 'build', 'dist', 'test']
-        )]
+        python_files = self._python_files(include_tests=False)
 
         for py_file in python_files:
             try:
                 with open(py_file, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                relative_path = str(py_file.relative_to(self.project_path))
+                relative_path = self._relative_path(py_file)
 
                 # Static security patterns
                 static_issues = self._find_security_patterns(content, relative_path)
@@ -517,16 +1187,9 @@ class MultiDimensionalAnalyzer:
 
         # Check for safety (dependency vulnerabilities)
         try:
-            safety_output = subprocess.run(
-                ['safety', 'check', '--json'],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=str(self.project_path)
-            )
+            safety_data = self._tool_result('safety')
 
-            if safety_output.stdout:
-                safety_data = json.loads(safety_output.stdout)
+            if safety_data is not None:
                 if safety_data:
                     result['vulnerabilities'].append({
                         'type': 'dependency',
@@ -544,9 +1207,11 @@ class MultiDimensionalAnalyzer:
         # Calculate score based on all findings
         all_issues = result['vulnerabilities'] + result['static_issues']
 
-        high_severity = sum(1 for v in all_issues if v.get('severity') in ['HIGH', 'high'])
-        medium_severity = sum(1 for v in all_issues if v.get('severity') in ['MEDIUM', 'medium'])
-        low_severity = sum(1 for v in all_issues if v.get('severity') in ['LOW', 'low'])
+        # One counting pass; bandit reports upper-case severities, the static patterns lower-case
+        severity_counts = Counter(v.get('severity') for v in all_issues)
+        high_severity = severity_counts['HIGH'] + severity_counts['high']
+        medium_severity = severity_counts['MEDIUM'] + severity_counts['medium']
+        low_severity = severity_counts['LOW'] + severity_counts['low']
 
         # Severity-based scoring
         penalty = (high_severity * 15) + (medium_severity * 5) + (low_severity * 1)
@@ -569,6 +1234,70 @@ class MultiDimensionalAnalyzer:
 
         return result
 
+    def _bandit_by_file(self, targets: List[str]) -> Optional[Dict[str, List[Dict]]]:
+        """Bandit's results for the targets grouped by filename; None if bandit gave no output"""
+        vulnerabilities = self._bandit_results(targets)
+        if vulnerabilities is None:
+            return None
+        by_file = {}
+        for v in vulnerabilities:
+            by_file.setdefault(v.get('filename'), []).append(v)
+        return by_file
+
+    def _bandit_results(self, targets: List[str]) -> Optional[List[Dict]]:
+        """Bandit's JSON `results` for the targets, scanned in batches; None if bandit gave no output.
+
+        Scans the same non-test sources as the static patterns, so generated, vendored and
+        test trees never reach bandit.
+        """
+        if targets == [self._project_str]:
+            candidates = self._python_files(include_tests=False)
+        else:
+            candidates = [
+                Path(target) for target in targets
+                if not _EXCLUDE_WITH_TESTS_RE.search(self._relative_path(Path(target)))
+            ]
+        files = [os.fspath(candidate) for candidate in candidates]
+
+        # Nothing to scan is an empty result, not a failed run
+        vulnerabilities = None if files else []
+        for start in range(0, len(files), _BANDIT_BATCH_SIZE):
+            batch = self._bandit_batch(files[start:start + _BANDIT_BATCH_SIZE])
+            if batch is not None:
+                if vulnerabilities is None:
+                    vulnerabilities = []
+                vulnerabilities.extend(batch)
+        return vulnerabilities
+
+    def _bandit_batch(self, files: List[str]) -> Optional[List[Dict]]:
+        """Bandit's JSON `results` for one batch, in-process when bandit is importable; None if no output"""
+        if bandit_manager is not None:
+            manager = bandit_manager.BanditManager(bandit_config.BanditConfig(), 'file', quiet=True)
+            manager.discover_files(files, recursive=True, excluded_paths=','.join(bandit_constants.EXCLUDE))
+            manager.run_tests()
+            return [issue.as_dict(with_code=False) for issue in manager.get_issue_list()]
+
+        bandit_output = subprocess.run(
+            ['bandit', '-f', 'json', *files],
+            capture_output=True,
+            timeout=60
+        )
+
+        # Bandit returns non-zero when it finds issues
+        if not bandit_output.stdout:
+            return None
+        return _json_loads(bandit_output.stdout).get('results', [])
+
+    def _safety_results(self) -> Optional[Any]:
+        """Parsed `safety check --json` output, or None when safety printed nothing"""
+        safety_output = subprocess.run(
+            ['safety', 'check', '--json'],
+            capture_output=True,
+            timeout=30,
+            cwd=self._project_str
+        )
+        return _json_loads(safety_output.stdout) if safety_output.stdout else None
+
     def _find_security_patterns(self, content: str, filename: str) -> List[Dict]:
         """Find security issues via static pattern analysis"""
         import re
@@ -662,38 +1391,19 @@ class MultiDimensionalAnalyzer:
         }
 
         # Analyze imports and dependencies
-        python_files = list(self.project_path.rglob('*.py'))
-        python_files = [f for f in python_files if not any(
-            part in str(f) for part in ['venv', '.venv', '__pycache__', 'node_modules', '.git', 'build', 'dist']
-        )]
+        python_files = self._python_files()
 
         # Build import graph for circular dependency detection
         import_graph = {}
         module_to_file = {}
+        god_classes = []
 
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-
-                relative_path = str(py_file.relative_to(self.project_path))
-                module_name = relative_path.replace('/', '.').replace('.py', '')
-
-                imports = []
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-
-                import_graph[module_name] = imports
-                module_to_file[module_name] = relative_path
-
-            except Exception:
-                continue
+        # Imports and god classes come from the shared per-file parse
+        for facts in self._collect_file_facts():
+            module_name = facts.relative_path.replace('/', '.').replace('.py', '')
+            import_graph[module_name] = facts.imports
+            module_to_file[module_name] = facts.relative_path
+            god_classes.extend(facts.god_classes)
 
         # Detect circular dependencies
         circular_deps = self._detect_circular_dependencies(import_graph)
@@ -701,7 +1411,6 @@ class MultiDimensionalAnalyzer:
         result['metrics']['circular_deps'] = len(circular_deps)
 
         # Detect god classes (SRP violation)
-        god_classes = self._find_god_classes(python_files)
         result['solid_violations'].extend(god_classes)
         result['metrics']['god_classes'] = len(god_classes)
 
@@ -744,6 +1453,10 @@ class MultiDimensionalAnalyzer:
         print(f"    - OCP violations: {result['metrics']['ocp_violations']}")
         print(f"    - DIP violations: {result['metrics']['dip_violations']}")
 
+        # Convert slotted finding records to plain dicts once, for the JSON report
+        result['solid_violations'] = [finding.to_dict() for finding in result['solid_violations']]
+        result['coupling_issues'] = [finding.to_dict() for finding in result['coupling_issues']]
+
         return result
 
     def _detect_circular_dependencies(self, import_graph: Dict[str, List[str]]) -> List[Dict]:
@@ -787,163 +1500,139 @@ class MultiDimensionalAnalyzer:
 
         return circular_deps
 
-    def _find_god_classes(self, python_files: List[Path]) -> List[Dict]:
-        """Find classes with too many methods (God Class anti-pattern)"""
-        god_classes = []
-
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-
-                relative_path = str(py_file.relative_to(self.project_path))
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        # Count methods
-                        method_count = sum(1 for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)))
-
-                        # Count class lines
-                        class_lines = node.end_lineno - node.lineno + 1 if hasattr(node, 'end_lineno') else 0
-
-                        if method_count > 20 or class_lines > 500:
-                            god_classes.append({
-                                'file': relative_path,
-                                'class': node.name,
-                                'line': node.lineno,
-                                'method_count': method_count,
-                                'class_lines': class_lines,
-                                'violation': 'Single Responsibility Principle',
-                                'message': f'Class has {method_count} methods and {class_lines} lines - consider splitting',
-                                'severity': 'medium'
-                            })
-
-            except Exception:
-                continue
-
-        return god_classes
-
-    def _find_tight_coupling(self, python_files: List[Path]) -> List[Dict]:
+    def _find_tight_coupling(self, python_files: List[Path]) -> List[CouplingFinding]:
         """Find tightly coupled classes"""
         coupling_issues = []
 
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-
-                relative_path = str(py_file.relative_to(self.project_path))
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        # Count external class instantiations in __init__
-                        init_instantiations = 0
-                        for item in node.body:
-                            if isinstance(item, ast.FunctionDef) and item.name == '__init__':
-                                for child in ast.walk(item):
-                                    if isinstance(child, ast.Call):
-                                        if isinstance(child.func, ast.Name):
-                                            # Check if it's a class instantiation (capitalized)
-                                            if child.func.id[0].isupper():
-                                                init_instantiations += 1
-
-                        if init_instantiations > 5:
-                            coupling_issues.append({
-                                'file': relative_path,
-                                'class': node.name,
-                                'line': node.lineno,
-                                'instantiations': init_instantiations,
-                                'message': f'Class creates {init_instantiations} dependencies in __init__ - consider dependency injection',
-                                'severity': 'medium'
-                            })
+                tree = _parse_if_contains(py_file, _CLASS_RE)
+                if tree is None:
+                    continue
+
+                relative_path = self._relative_path(py_file)
+
+                for node in _iter_class_defs(tree):
+                    # Count external class instantiations in __init__
+                    init_instantiations = 0
+                    for item in node.body:
+                        if isinstance(item, ast.FunctionDef) and item.name == '__init__':
+                            for child in _iter_direct_calls(item.body):
+                                if isinstance(child.func, ast.Name):
+                                    # Check if it's a class instantiation (capitalized)
+                                    if 'A' <= child.func.id[:1] <= 'Z':
+                                        init_instantiations += 1
+
+                    if init_instantiations > 5:
+                        coupling_issues.append(CouplingFinding(
+                            file=relative_path,
+                            class_name=node.name,
+                            line=node.lineno,
+                            instantiations=init_instantiations,
+                            message=f'Class creates {init_instantiations} dependencies in __init__ - consider dependency injection',
+                            severity='medium'
+                        ))
 
             except Exception:
                 continue
 
         return coupling_issues
 
-    def _find_ocp_violations(self, python_files: List[Path]) -> List[Dict]:
+    def _find_ocp_violations(self, python_files: List[Path]) -> List[OcpFinding]:
         """Find Open/Closed Principle violations (long if-elif chains)"""
         import re
         violations = []
 
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
+                tree = _parse_if_contains(py_file, _DEF_RE)
+                if tree is None:
+                    continue
 
-                relative_path = str(py_file.relative_to(self.project_path))
+                relative_path = self._relative_path(py_file)
+
+                # One breadth-first descent per file, in ast.walk order, carrying every enclosing
+                # FunctionDef: each function reports the first long chain its own walk would reach,
+                # and an outer function also reports chains inside its nested functions
+                first_chain = {}  # function -> (chain head, chain length), first found only
+                functions = []  # Functions in the order ast.walk reaches them
+                pending = deque([(tree, ())])
+                while pending:
+                    node, enclosing = pending.popleft()
 
-                for node in ast.walk(tree):
                     if isinstance(node, ast.FunctionDef):
-                        # Check for long elif chains
-                        for child in ast.walk(node):
-                            if isinstance(child, ast.If):
-                                # Count elif branches
-                                current = child
-                                chain_length = 1
-                                while current.orelse:
-                                    if len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If):
-                                        chain_length += 1
-                                        current = current.orelse[0]
-                                    else:
-                                        break
-
-                                if chain_length >= 5:
-                                    violations.append({
-                                        'file': relative_path,
-                                        'function': node.name,
-                                        'line': child.lineno,
-                                        'elif_count': chain_length,
-                                        'violation': 'Open/Closed Principle',
-                                        'message': f'Long if-elif chain ({chain_length} branches) - consider polymorphism or strategy pattern',
-                                        'severity': 'low'
-                                    })
-                                    break  # Only report once per function
+                        enclosing += (node,)
+                        functions.append(node)
+                    elif isinstance(node, ast.If) and any(f not in first_chain for f in enclosing):
+                        # Count elif branches
+                        current = node
+                        chain_length = 1
+                        while len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If):
+                            chain_length += 1
+                            current = current.orelse[0]
+                        if chain_length >= 5:
+                            for function in enclosing:
+                                first_chain.setdefault(function, (node, chain_length))
+
+                    # Expressions never contain statements, so only statement-bearing children are queued
+                    pending.extend((child, enclosing) for child in ast.iter_child_nodes(node)
+                                   if isinstance(child, _STMT_TYPES))
+
+                # Only report once per function, in the order the functions were reached
+                for function in functions:
+                    chain = first_chain.get(function)
+                    if chain is not None:
+                        head, chain_length = chain
+                        violations.append(OcpFinding(
+                            file=relative_path,
+                            function=function.name,
+                            line=head.lineno,
+                            elif_count=chain_length,
+                            violation='Open/Closed Principle',
+                            message=f'Long if-elif chain ({chain_length} branches) - consider polymorphism or strategy pattern',
+                            severity='low'
+                        ))
 
             except Exception:
                 continue
 
         return violations
 
-    def _find_dip_violations(self, python_files: List[Path]) -> List[Dict]:
+    def _find_dip_violations(self, python_files: List[Path]) -> List[DipFinding]:
         """Find Dependency Inversion Principle violations (concrete dependencies)"""
         violations = []
 
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-
-                relative_path = str(py_file.relative_to(self.project_path))
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        # Check for concrete class attributes (not dependency injection)
-                        concrete_deps = []
-
-                        for item in node.body:
-                            # Class-level instantiations (not in __init__)
-                            if isinstance(item, ast.Assign):
-                                for target in item.targets:
-                                    if isinstance(item.value, ast.Call):
-                                        if isinstance(item.value.func, ast.Name):
-                                            if item.value.func.id[0].isupper():
-                                                concrete_deps.append(item.value.func.id)
-
-                        if len(concrete_deps) >= 3:
-                            violations.append({
-                                'file': relative_path,
-                                'class': node.name,
-                                'line': node.lineno,
-                                'concrete_deps': concrete_deps,
-                                'violation': 'Dependency Inversion Principle',
-                                'message': f'Class has {len(concrete_deps)} concrete dependencies at class level - use dependency injection',
-                                'severity': 'low'
-                            })
+                tree = _parse_if_contains(py_file, _CLASS_RE)
+                if tree is None:
+                    continue
+
+                relative_path = self._relative_path(py_file)
+
+                for node in _iter_class_defs(tree):
+                    # Check for concrete class attributes (not dependency injection)
+                    concrete_deps = []
+
+                    for item in node.body:
+                        # Class-level instantiations (not in __init__)
+                        if isinstance(item, ast.Assign):
+                            for target in item.targets:
+                                if isinstance(item.value, ast.Call):
+                                    if isinstance(item.value.func, ast.Name):
+                                        if 'A' <= item.value.func.id[:1] <= 'Z':
+                                            concrete_deps.append(item.value.func.id)
+
+                    if len(concrete_deps) >= 3:
+                        violations.append(DipFinding(
+                            file=relative_path,
+                            class_name=node.name,
+                            line=node.lineno,
+                            concrete_deps=concrete_deps,
+                            violation='Dependency Inversion Principle',
+                            message=f'Class has {len(concrete_deps)} concrete dependencies at class level - use dependency injection',
+                            severity='low'
+                        ))
 
             except Exception:
                 continue
@@ -967,48 +1656,40 @@ class MultiDimensionalAnalyzer:
             }
         }
 
-        python_files = list(self.project_path.rglob('*.py'))
-        python_files = [f for f in python_files if not any(
-            part in str(f) for part in ['venv', '.venv', '__pycache__', 'node_modules', '.git', 'build', 'dist', 'test']
-        )]
+        python_files = self._python_files(include_tests=False)
 
         pylint_used = False
 
-        # Run Pylint similarity checker
-        try:
-            pylint_output = subprocess.run(
-                ['pylint', '--disable=all', '--enable=similarities',
-                 str(self.project_path), '--output-format=json'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+        # Run Pylint similarity checker (opt-in: it re-parses the whole project in a subprocess)
+        if self.use_pylint:
+            try:
+                pylint_output = self._tool_result('pylint')
+
+                if pylint_output:
+                    try:
+                        pylint_data = _json_loads(pylint_output)
+
+                        similar_code = [msg for msg in pylint_data if msg.get('symbol') == 'duplicate-code']
+                        result['duplicate_blocks'] = [
+                            {
+                                'file': msg.get('path'),
+                                'line': msg.get('line'),
+                                'message': msg.get('message'),
+                                'source': 'pylint'
+                            }
+                            for msg in similar_code
+                        ]
+                        pylint_used = True
 
-            if pylint_output.stdout:
-                try:
-                    pylint_data = json.loads(pylint_output.stdout)
-
-                    similar_code = [msg for msg in pylint_data if msg.get('symbol') == 'duplicate-code']
-                    result['duplicate_blocks'] = [
-                        {
-                            'file': msg.get('path'),
-                            'line': msg.get('line'),
-                            'message': msg.get('message'),
-                            'source': 'pylint'
-                        }
-                        for msg in similar_code
-                    ]
-                    pylint_used = True
-
-                except json.JSONDecodeError:
-                    pass
+                    except json.JSONDecodeError:
+                        pass
 
-        except FileNotFoundError:
-            print("  ⚠️  Pylint not installed - using hash-based duplication detection")
-        except Exception as e:
-            print(f"  Warning: Similarity analysis failed - {e}")
+            except FileNotFoundError:
+                print("  ⚠️  Pylint not installed - using hash-based duplication detection")
+            except Exception as e:
+                print(f"  Warning: Similarity analysis failed - {e}")
 
-        # Fallback: Hash-based duplication detection if pylint not available
+        # Default: in-process hash-based duplication detection
         if not pylint_used:
             hash_duplicates = self._detect_duplicates_with_hashing(python_files)
             result['duplicate_blocks'].extend(hash_duplicates)
@@ -1044,61 +1725,53 @@ class MultiDimensionalAnalyzer:
 
         return result
 
+    def _pylint_results(self) -> str:
+        """Raw JSON from pylint's similarity checker; parsed by the caller, which tolerates bad output"""
+        pylint_output = subprocess.run(
+            ['pylint', '--disable=all', '--enable=similarities', f'--ignore={_PYLINT_IGNORE}',
+             self._project_str, '--output-format=json'],
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        return pylint_output.stdout
+
     def _detect_duplicates_with_hashing(self, python_files: List[Path]) -> List[Dict]:
-        """Fallback duplication detection using hash comparison"""
+        """Fallback duplication detection using a rolling hash over normalized lines"""
         duplicates = []
-        block_hashes: Dict[int, List[Dict]] = {}
-
-        def simple_hash(text: str) -> int:
-            """Simple DJB2-style hash"""
-            h = 5381
-            for char in text:
-                h = ((h << 5) + h) + ord(char)
-            return h & 0xFFFFFFFF
-
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-
-                relative_path = str(py_file.relative_to(self.project_path))
-
-                # Check blocks of 5+ lines
-                block_size = 5
-                for i in range(len(lines) - block_size + 1):
-                    block = ''.join(lines[i:i + block_size])
-                    # Normalize whitespace
-                    normalized = ' '.join(block.split())
-
-                    # Skip empty or trivial blocks
-                    if len(normalized) < 50:
-                        continue
-
-                    block_hash = simple_hash(normalized)
-
-                    if block_hash in block_hashes:
-                        # Found potential duplicate
-                        for existing in block_hashes[block_hash]:
-                            if existing['file'] != relative_path or abs(existing['line'] - (i + 1)) > block_size:
-                                duplicates.append({
-                                    'file': relative_path,
-                                    'line': i + 1,
-                                    'similar_to': existing['file'],
-                                    'similar_line': existing['line'],
-                                    'message': f'Similar code block ({block_size} lines)',
-                                    'source': 'hash_detection'
-                                })
-                                break
-                    else:
-                        block_hashes[block_hash] = []
-
-                    block_hashes[block_hash].append({
-                        'file': relative_path,
-                        'line': i + 1
-                    })
+        block_hashes: Dict[tuple, List[Dict]] = {}
+        block_size = 5
+
+        # Hash extraction is independent per file; only the collision check needs shared state
+        project_roots = [self.project_path] * len(python_files)
+        if len(python_files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(mp_context=_POOL_CONTEXT) as executor:
+                batches = list(executor.map(_hash_blocks, python_files, project_roots, chunksize=32))
+        else:
+            batches = list(map(_hash_blocks, python_files, project_roots))
+
+        for batch in batches:
+            for block_key, relative_path, start_line in batch:
+                if block_key in block_hashes:
+                    # Found potential duplicate
+                    for existing in block_hashes[block_key]:
+                        if existing['file'] != relative_path or abs(existing['line'] - start_line) > block_size:
+                            duplicates.append({
+                                'file': relative_path,
+                                'line': start_line,
+                                'similar_to': existing['file'],
+                                'similar_line': existing['line'],
+                                'message': f'Similar code block ({block_size} lines)',
+                                'source': 'hash_detection'
+                            })
+                            break
+                else:
+                    block_hashes[block_key] = []
 
-            except Exception:
-                continue
+                block_hashes[block_key].append({
+                    'file': relative_path,
+                    'line': start_line
+                })
 
         return duplicates[:50]  # Limit results
 
@@ -1112,17 +1785,19 @@ class MultiDimensionalAnalyzer:
 
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
+                # compile() decodes bytes itself, honouring PEP 263 coding declarations
+                with open(py_file, 'rb') as f:
+                    tree = _parse(f.read(), str(py_file))
 
-                relative_path = str(py_file.relative_to(self.project_path))
+                relative_path = self._relative_path(py_file)
+                local_usages = []
+                imports = []
 
-                # Collect function and class definitions
+                # Collect definitions, usages and imports in a single walk
                 for node in ast.walk(tree):
                     if isinstance(node, ast.FunctionDef):
                         # Skip private/magic methods
-                        if not node.name.startswith('_'):
+                        if node.name[:1] != '_':
                             key = f"{relative_path}:{node.name}"
                             all_definitions[key] = {
                                 'file': relative_path,
@@ -1132,7 +1807,7 @@ class MultiDimensionalAnalyzer:
                             }
 
                     elif isinstance(node, ast.ClassDef):
-                        if not node.name.startswith('_'):
+                        if node.name[:1] != '_':
                             key = f"{relative_path}:{node.name}"
                             all_definitions[key] = {
                                 'file': relative_path,
@@ -1142,23 +1817,29 @@ class MultiDimensionalAnalyzer:
                             }
 
                     elif isinstance(node, ast.Name):
-                        all_usages.add(node.id)
+                        local_usages.append(node.id)
 
                     elif isinstance(node, ast.Attribute):
-                        all_usages.add(node.attr)
+                        local_usages.append(node.attr)
 
                     elif isinstance(node, ast.Call):
                         if isinstance(node.func, ast.Name):
-                            all_usages.add(node.func.id)
+                            local_usages.append(node.func.id)
                         elif isinstance(node.func, ast.Attribute):
-                            all_usages.add(node.func.attr)
+                            local_usages.append(node.func.attr)
 
-                # Detect unused imports
-                for node in ast.walk(tree):
+                    elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                        imports.append(node)
+
+                # One C-level bulk insert per file instead of a set.add per node
+                all_usages.update(local_usages)
+
+                # Detect unused imports (after this file's usages are merged)
+                for node in imports:
                     if isinstance(node, ast.Import):
                         for alias in node.names:
                             name = alias.asname or alias.name.split('.')[0]
-                            if name not in all_usages and not name.startswith('_'):
+                            if name not in all_usages and name[:1] != '_':
                                 dead_code.append({
                                     'file': relative_path,
                                     'line': node.lineno,
@@ -1171,7 +1852,7 @@ class MultiDimensionalAnalyzer:
                     elif isinstance(node, ast.ImportFrom):
                         for alias in node.names:
                             name = alias.asname or alias.name
-                            if name not in all_usages and name != '*' and not name.startswith('_'):
+                            if name not in all_usages and name != '*' and name[:1] != '_':
                                 dead_code.append({
                                     'file': relative_path,
                                     'line': node.lineno,
@@ -1184,6 +1865,9 @@ class MultiDimensionalAnalyzer:
             except Exception:
                 continue
 
+        # Usages are complete; freeze for the membership-heavy pass below
+        all_usages = frozenset(all_usages)
+
         # Check for potentially unused functions/classes (heuristic)
         for key, defn in all_definitions.items():
             if defn['name'] not in all_usages:
@@ -1223,7 +1907,7 @@ class MultiDimensionalAnalyzer:
                 with open(py_file, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                relative_path = str(py_file.relative_to(self.project_path))
+                relative_path = self._relative_path(py_file)
 
                 for pattern, message in extractable_patterns:
                     matches = list(re.finditer(pattern, content))
@@ -1319,6 +2003,21 @@ def main():
         action='store_true',
         help='Analyze all dimensions (same as --dimensions all)'
     )
+    parser.add_argument(
+        '--use-pylint',
+        action='store_true',
+        help='Use pylint similarity checker for duplication (slow; default: built-in hash detection)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse every file instead of reusing per-file results from .refactoring-cache/'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only re-analyze Python files changed since this git ref; results for the rest come from the cache'
+    )
     
     args = parser.parse_args()
     
@@ -1333,15 +2032,21 @@ def main():
     check_dependencies(dimensions)
 
     # Run analysis
-    analyzer = MultiDimensionalAnalyzer(args.project, dimensions)
+    analyzer = MultiDimensionalAnalyzer(
+        args.project, dimensions, use_pylint=args.use_pylint, use_cache=not args.no_cache, since=args.since
+    )
     results = analyzer.analyze()
     
     # Save results
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        # Native serializer; much faster than json.dump on large nested reports
+        output_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\n✅ Analysis complete!")
     print(f"📊 Overall Health Score: {results['overall_health']}/100")
@@ -7,21 +7,63 @@ refactoring opportunities, code smells, and technical debt.
 
 Dependencies:
     pip install pylint radon rope --break-system-packages
+
+Optional (faster cache keys and report output):
+    pip install xxhash orjson --break-system-packages
 """
 
 import argparse
 import ast
+import hashlib
+import importlib.util
 import json
 import os
+import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, asdict
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 import re
 
+try:
+    from radon.complexity import cc_visit_ast
+    from radon.metrics import mi_visit, mi_rank
+except ImportError:
+    cc_visit_ast = mi_visit = mi_rank = None
+
+# Cache keys only need to be stable, not collision-resistant: prefer the much faster xxh3
+try:
+    from xxhash import xxh3_64_hexdigest as _content_hash
+except ImportError:
+    def _content_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+# Non-source directories never descended into (dot-directories are skipped as well)
+_EXCLUDE_DIRS = frozenset({'venv', '__pycache__', 'node_modules', 'build', 'dist'})
+
+# Node types that can contain statements; expression subtrees are never walked
+_STMT_TYPES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+# Bump when cached issue records change shape
+_CACHE_SCHEMA_VERSION = 2
+_ISSUES_CACHE_NAMESPACE = f"issues-v{_CACHE_SCHEMA_VERSION}"
+
+# radon block letter -> block type as reported by `radon cc -j`
+_RADON_BLOCK_TYPES = {'F': 'function', 'M': 'method', 'C': 'class'}
+
+# Report ordering: most severe first
+_SEVERITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+# Files per `radon` CLI invocation when only the command-line tool is available
+_RADON_BATCH_SIZE = 200
+
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisIssue:
     """Represents a single refactoring issue found during analysis"""
     severity: str  # critical, high, medium, low
@@ -36,14 +78,191 @@ class AnalysisIssue:
     risk: str  # high, medium, low
     impact: str  # high, medium, low
     metrics: Dict[str, Any]
+    severity_idx: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.severity_idx = _SEVERITY_ORDER[self.severity]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict for JSON output (cheaper than dataclasses.asdict's recursive copy)"""
+        return {
+            'severity': self.severity,
+            'category': self.category,
+            'title': self.title,
+            'description': self.description,
+            'file': self.file,
+            'line': self.line,
+            'end_line': self.end_line,
+            'suggested_refactoring': self.suggested_refactoring,
+            'automated': self.automated,
+            'risk': self.risk,
+            'impact': self.impact,
+            'metrics': self.metrics
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class _FileContext:
+    """One file's raw source, parsed tree and report path, built once and shared by every phase"""
+    path: Path
+    source: bytes
+    tree: ast.AST
+    rel_path: str
+
+
+class _IssueVisitor:
+    """Emits smell (long method, many parameters, large class) and nesting issues in one walk"""
+    
+    def __init__(self, relative_path: str, config: Dict[str, Any]):
+        self.relative_path = relative_path
+        self.config = config
+        # Thresholds are fixed for the whole walk; read them once, not per node
+        self.max_method_length = config.get('max_method_length', 50)
+        self.max_class_length = config.get('max_class_length', 300)
+        self.issues: List[AnalysisIssue] = []
+        # Exact-type dispatch; every other statement just passes its depth on to its children
+        self._handlers: Dict[type, Any] = {
+            ast.FunctionDef: self._visit_function,
+            ast.AsyncFunctionDef: self._visit_function,
+            ast.ClassDef: self._visit_class,
+            ast.For: self._visit_loop,
+            ast.While: self._visit_loop,
+            ast.If: self._visit_if,
+        }
+    
+    def visit(self, tree: ast.AST):
+        """Walk the statements of a tree with an explicit stack of (node, nesting depth) pairs"""
+        handlers = self._handlers
+        push_children = self._push_children
+        stack = [(tree, 0)]
+        pop = stack.pop
+        
+        while stack:
+            node, depth = pop()
+            handler = handlers.get(type(node))
+            if handler is None:
+                push_children(stack, node, depth)
+            else:
+                handler(node, depth, stack)
+    
+    def _visit_function(self, node: ast.AST, depth: int, stack: list):
+        # Detect long methods
+        func_length = node.end_lineno - node.lineno + 1
+        
+        if func_length > self.max_method_length:
+            self.issues.append(AnalysisIssue(
+                severity='medium',
+                category='smell',
+                title=f"Long method: {func_length} lines",
+                description=f"Method '{node.name}' is {func_length} lines, should be < {self.max_method_length}",
+                file=self.relative_path,
+                line=node.lineno,
+                end_line=node.end_lineno,
+                suggested_refactoring='extract_method',
+                automated=True,
+                risk='low',
+                impact='medium',
+                metrics={'length': func_length}
+            ))
+        
+        # Detect too many parameters
+        param_count = len(node.args.args)
+        if param_count > 5:
+            self.issues.append(AnalysisIssue(
+                severity='low',
+                category='smell',
+                title=f"Too many parameters: {param_count}",
+                description=f"Method '{node.name}' has {param_count} parameters, should be < 5",
+                file=self.relative_path,
+                line=node.lineno,
+                end_line=node.end_lineno,
+                suggested_refactoring='introduce_parameter_object',
+                automated=False,
+                risk='medium',
+                impact='low',
+                metrics={'param_count': param_count}
+            ))
+        
+        # Nesting is counted from zero inside a def
+        self._push_children(stack, node, 0)
+    
+    def _visit_class(self, node: ast.ClassDef, depth: int, stack: list):
+        # Detect large classes
+        class_length = node.end_lineno - node.lineno + 1
+        
+        if class_length > self.max_class_length:
+            self.issues.append(AnalysisIssue(
+                severity='high',
+                category='smell',
+                title=f"Large class: {class_length} lines",
+                description=f"Class '{node.name}' is {class_length} lines, should be < {self.max_class_length}",
+                file=self.relative_path,
+                line=node.lineno,
+                end_line=node.end_lineno,
+                suggested_refactoring='extract_class',
+                automated=False,
+                risk='medium',
+                impact='high',
+                metrics={'length': class_length}
+            ))
+        
+        self._push_children(stack, node, 0)
+    
+    def _visit_loop(self, node: ast.AST, depth: int, stack: list):
+        # Detect nested conditionals: depth travels with each stack entry
+        depth += 1
+        self._enter_control(node, depth)
+        self._push_children(stack, node, depth)
+    
+    def _visit_if(self, node: ast.If, depth: int, stack: list):
+        self._enter_control(node, depth + 1)
+        if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+            # An elif sits at the same level as its if, not one deeper;
+            # pushed first so it pops after the if's body
+            stack.append((node.orelse[0], depth))
+            stack.extend([(child, depth + 1) for child in reversed(node.body)])
+        else:
+            self._push_children(stack, node, depth + 1)
+    
+    def _enter_control(self, node: ast.AST, depth: int):
+        """Report a control-flow statement that sits too deep"""
+        if depth > 3:
+            self.issues.append(AnalysisIssue(
+                severity='medium',
+                category='complexity',
+                title=f"Deep nesting: {depth} levels",
+                description=f"Conditional nesting depth is {depth}, should be < 3",
+                file=self.relative_path,
+                line=node.lineno,
+                end_line=node.end_lineno,
+                suggested_refactoring='decompose_conditional',
+                automated=True,
+                risk='low',
+                impact='medium',
+                metrics={'nesting_depth': depth}
+            ))
+    
+    @staticmethod
+    def _push_children(stack: list, node: ast.AST, depth: int):
+        """Queue a node's statement children; defs and control flow never occur inside expressions"""
+        # Reversed so children pop off the stack in source order
+        stack.extend([
+            (child, depth) for child in reversed(list(ast.iter_child_nodes(node)))
+            if isinstance(child, _STMT_TYPES)
+        ])
 
 
 class PythonAnalyzer:
     """Main analyzer for Python projects"""
     
-    def __init__(self, project_path: str, config: Dict[str, Any]):
+    def __init__(self, project_path: str, config: Dict[str, Any], jobs: int = None, use_cache: bool = True):
         self.project_path = Path(project_path).absolute()
         self.config = config
+        self.max_complexity = config.get('max_complexity', 10)
+        self.min_maintainability_index = config.get('min_maintainability_index', 65)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_cache = use_cache
+        self.cache_dir = self.project_path / '.refactoring-cache'
         self.issues: List[AnalysisIssue] = []
         self.metrics = {
             "total_files": 0,
@@ -57,310 +276,310 @@ class PythonAnalyzer:
         """Run comprehensive analysis"""
         print(f"🔍 Analyzing Python project: {self.project_path}")
         
-        python_files = self._find_python_files()
+        python_files = list(self._find_python_files())
         self.metrics["total_files"] = len(python_files)
         
         print(f"📁 Found {len(python_files)} Python files")
         
-        # Phase 1: Complexity Analysis
-        print("\n🧮 Analyzing complexity...")
-        complexity_issues = self._analyze_complexity(python_files)
-        self.issues.extend(complexity_issues)
-        
-        # Phase 2: Code Smells Detection
-        print("👃 Detecting code smells...")
-        smell_issues = self._detect_code_smells(python_files)
-        self.issues.extend(smell_issues)
+        radon_cli = shutil.which('radon') if cc_visit_ast is None else None
+        if cc_visit_ast is None and radon_cli is None:
+            print("⚠️  radon not installed - skipping complexity and maintainability index")
         
-        # Phase 3: AST-based Analysis
-        print("🌳 Performing AST analysis...")
-        ast_issues = self._analyze_ast(python_files)
-        self.issues.extend(ast_issues)
+        # Files are independent: run all phases per file, fanned out across processes
+        print(f"\n🧮 Analyzing complexity, smells, nesting and maintainability ({self.jobs} jobs)...")
+        if self.jobs > 1 and len(python_files) > 1:
+            chunksize = max(1, len(python_files) // (4 * self.jobs))
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                for file_issues, line_count in executor.map(
+                    _analyze_one, python_files, repeat(self.project_path), repeat(self.config),
+                    repeat(self.use_cache), chunksize=chunksize
+                ):
+                    self.issues.extend(file_issues)
+                    self.metrics["total_lines"] += line_count
+        else:
+            for file in python_files:
+                file_issues, line_count = _analyze_one(file, self.project_path, self.config, self.use_cache)
+                self.issues.extend(file_issues)
+                self.metrics["total_lines"] += line_count
         
-        # Phase 4: Maintainability Index
-        print("📊 Calculating maintainability...")
-        maint_issues = self._analyze_maintainability(python_files)
-        self.issues.extend(maint_issues)
+        if radon_cli:
+            print("\n📊 radon module not importable - running the radon CLI in batches...")
+            self.issues.extend(self._analyze_radon_cli(radon_cli, python_files))
         
         # Generate report
         return self._generate_report()
     
-    def _find_python_files(self) -> List[Path]:
-        """Find all Python files in the project"""
-        python_files = []
-        exclude_dirs = {'.venv', 'venv', '__pycache__', '.git', 'node_modules', 'build', 'dist'}
-        
-        for root, dirs, files in os.walk(self.project_path):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(Path(root) / file)
+    def _find_python_files(self) -> Iterator[Path]:
+        """Lazily yield all Python files in the project"""
+        pending = deque([self.project_path])
         
-        return python_files
+        while pending:
+            directory = pending.popleft()
+            try:
+                # scandir's DirEntry carries the file type, so no extra stat() per entry
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Filter out hidden (.git, .venv, .tox, caches...) and excluded directories
+                            if entry.name[:1] != '.' and entry.name not in _EXCLUDE_DIRS:
+                                pending.append(entry.path)
+                        elif entry.name.endswith('.py') and entry.is_file():
+                            yield Path(entry.path)
+            except OSError:
+                continue
     
-    def _analyze_complexity(self, files: List[Path]) -> List[AnalysisIssue]:
-        """Analyze cyclomatic complexity using Radon"""
-        issues = []
+    def _analyze_file(self, file: Path) -> Tuple[List[AnalysisIssue], int]:
+        """Run every analysis phase on one file, reading and parsing it once; returns (issues, line count)"""
+        try:
+            source_bytes = file.read_bytes()
+        except OSError as e:
+            print(f"⚠️  Error reading {file}: {e}")
+            return [], 0
         
-        for file in files:
+        # memchr-speed scan over the raw bytes; no str is built just to count lines
+        line_count = source_bytes.count(b'\n')
+        digest = _content_hash(source_bytes)
+        # Computed once here; every issue for this file reports the same path
+        rel_path = str(file.relative_to(self.project_path))
+        
+        # Unchanged source + unchanged thresholds: reuse the previous run's issues outright
+        issues_file = self._issues_cache_file(rel_path, digest) if self.use_cache else None
+        if issues_file is not None:
             try:
-                # Run radon cc for cyclomatic complexity
-                result = subprocess.run(
-                    ['radon', 'cc', str(file), '-s', '-j'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    continue
-                
-                data = json.loads(result.stdout)
-                
-                for item in data.get(str(file), []):
-                    complexity = item.get('complexity', 0)
-                    
-                    if complexity > self.config.get('max_complexity', 10):
-                        severity = 'critical' if complexity > 20 else 'high' if complexity > 15 else 'medium'
-                        
-                        issues.append(AnalysisIssue(
-                            severity=severity,
-                            category='complexity',
-                            title=f"High cyclomatic complexity: {complexity}",
-                            description=f"Function '{item['name']}' has complexity {complexity}, threshold is {self.config.get('max_complexity', 10)}",
-                            file=str(file.relative_to(self.project_path)),
-                            line=item['lineno'],
-                            end_line=item['endline'],
-                            suggested_refactoring='extract_method',
-                            automated=True,
-                            risk='low',
-                            impact='high',
-                            metrics={'complexity': complexity, 'type': item['type']}
-                        ))
-            
-            except Exception as e:
-                print(f"⚠️  Error analyzing {file}: {e}")
+                with open(issues_file, 'r', encoding='utf-8') as f:
+                    return [AnalysisIssue(**item) for item in json.load(f)], line_count
+            except Exception:
+                # Unreadable, corrupt or older-schema entries are just a miss; recomputed below
+                pass
         
-        return issues
+        try:
+            # ast.parse decodes bytes itself (honouring PEP 263 coding cookies)
+            tree = ast.parse(source_bytes, filename=str(file))
+        except (SyntaxError, ValueError) as e:
+            print(f"⚠️  Error parsing {file}: {e}")
+            return [], line_count
+        
+        ctx = _FileContext(file, source_bytes, tree, rel_path)
+        issues = self._analyze_complexity(ctx)
+        issues.extend(self._analyze_source_ast(ctx))
+        issues.extend(self._analyze_maintainability(ctx))
+        
+        if issues_file is not None:
+            payload = json.dumps([issue.to_dict() for issue in issues]).encode('utf-8')
+            self._write_cache(issues_file, payload)
+        
+        return issues, line_count
+    
+    def _issues_cache_file(self, rel_path: str, digest: str) -> Path:
+        """Issue-cache location for a file's content, path, thresholds and radon availability"""
+        key_material = '\0'.join([
+            digest,
+            rel_path,
+            json.dumps(self.config, sort_keys=True),
+            str(cc_visit_ast is not None),
+        ])
+        key = _content_hash(key_material.encode('utf-8'))
+        return self.cache_dir / _ISSUES_CACHE_NAMESPACE / key[:2] / f"{key[2:]}.json"
     
-    def _detect_code_smells(self, files: List[Path]) -> List[AnalysisIssue]:
-        """Detect code smells through AST analysis"""
+    def _write_cache(self, cache_file: Path, payload: bytes):
+        """Best-effort cache write (e.g. read-only checkouts are fine)"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent workers never read a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    
+    def _analyze_complexity(self, ctx: _FileContext) -> List[AnalysisIssue]:
+        """Analyze cyclomatic complexity using Radon"""
         issues = []
         
-        for file in files:
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    source = f.read()
-                    tree = ast.parse(source, filename=str(file))
-                
-                # Detect long methods
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        func_length = node.end_lineno - node.lineno + 1
-                        
-                        if func_length > self.config.get('max_method_length', 50):
-                            issues.append(AnalysisIssue(
-                                severity='medium',
-                                category='smell',
-                                title=f"Long method: {func_length} lines",
-                                description=f"Method '{node.name}' is {func_length} lines, should be < {self.config.get('max_method_length', 50)}",
-                                file=str(file.relative_to(self.project_path)),
-                                line=node.lineno,
-                                end_line=node.end_lineno,
-                                suggested_refactoring='extract_method',
-                                automated=True,
-                                risk='low',
-                                impact='medium',
-                                metrics={'length': func_length}
-                            ))
-                        
-                        # Detect too many parameters
-                        param_count = len(node.args.args)
-                        if param_count > 5:
-                            issues.append(AnalysisIssue(
-                                severity='low',
-                                category='smell',
-                                title=f"Too many parameters: {param_count}",
-                                description=f"Method '{node.name}' has {param_count} parameters, should be < 5",
-                                file=str(file.relative_to(self.project_path)),
-                                line=node.lineno,
-                                end_line=node.end_lineno,
-                                suggested_refactoring='introduce_parameter_object',
-                                automated=False,
-                                risk='medium',
-                                impact='low',
-                                metrics={'param_count': param_count}
-                            ))
-                    
-                    # Detect large classes
-                    if isinstance(node, ast.ClassDef):
-                        class_length = node.end_lineno - node.lineno + 1
-                        
-                        if class_length > self.config.get('max_class_length', 300):
-                            issues.append(AnalysisIssue(
-                                severity='high',
-                                category='smell',
-                                title=f"Large class: {class_length} lines",
-                                description=f"Class '{node.name}' is {class_length} lines, should be < {self.config.get('max_class_length', 300)}",
-                                file=str(file.relative_to(self.project_path)),
-                                line=node.lineno,
-                                end_line=node.end_lineno,
-                                suggested_refactoring='extract_class',
-                                automated=False,
-                                risk='medium',
-                                impact='high',
-                                metrics={'length': class_length}
-                            ))
-            
-            except Exception as e:
-                print(f"⚠️  Error detecting smells in {file}: {e}")
+        if cc_visit_ast is None:
+            return issues
+        
+        max_complexity = self.max_complexity
+        
+        # In-process radon on the already-parsed tree (no per-file subprocess)
+        for block in cc_visit_ast(ctx.tree):
+            if block.complexity > max_complexity:
+                issues.append(self._complexity_issue(
+                    ctx.rel_path, block.name, block.complexity,
+                    block.lineno, block.endline, _RADON_BLOCK_TYPES.get(block.letter, 'function')
+                ))
         
         return issues
     
-    def _analyze_ast(self, files: List[Path]) -> List[AnalysisIssue]:
-        """Perform deeper AST-based analysis"""
+    def _complexity_issue(self, rel_path: str, name: str, complexity: int,
+                          line: int, end_line: int, block_type: str) -> AnalysisIssue:
+        """Build a complexity issue for one radon block"""
+        severity = 'critical' if complexity > 20 else 'high' if complexity > 15 else 'medium'
+        
+        return AnalysisIssue(
+            severity=severity,
+            category='complexity',
+            title=f"High cyclomatic complexity: {complexity}",
+            description=f"Function '{name}' has complexity {complexity}, threshold is {self.max_complexity}",
+            file=rel_path,
+            line=line,
+            end_line=end_line,
+            suggested_refactoring='extract_method',
+            automated=True,
+            risk='low',
+            impact='high',
+            metrics={'complexity': complexity, 'type': block_type}
+        )
+    
+    def _analyze_source_ast(self, ctx: _FileContext) -> List[AnalysisIssue]:
+        """Detect code smells and deep nesting in a single traversal of the parsed tree"""
+        visitor = _IssueVisitor(ctx.rel_path, self.config)
+        visitor.visit(ctx.tree)
+        return visitor.issues
+    
+    def _analyze_maintainability(self, ctx: _FileContext) -> List[AnalysisIssue]:
+        """Analyze maintainability index using Radon"""
         issues = []
         
-        for file in files:
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    source = f.read()
-                    tree = ast.parse(source, filename=str(file))
-                
-                # Detect nested conditionals
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.If, ast.For, ast.While)):
-                        depth = self._get_nesting_depth(node)
-                        
-                        if depth > 3:
-                            issues.append(AnalysisIssue(
-                                severity='medium',
-                                category='complexity',
-                                title=f"Deep nesting: {depth} levels",
-                                description=f"Conditional nesting depth is {depth}, should be < 3",
-                                file=str(file.relative_to(self.project_path)),
-                                line=node.lineno,
-                                end_line=node.end_lineno,
-                                suggested_refactoring='decompose_conditional',
-                                automated=True,
-                                risk='low',
-                                impact='medium',
-                                metrics={'nesting_depth': depth}
-                            ))
-            
-            except Exception as e:
-                print(f"⚠️  Error in AST analysis of {file}: {e}")
+        if mi_visit is None:
+            return issues
+        
+        try:
+            # radon needs text; decode only here, honouring coding cookies like ast.parse
+            mi_score = mi_visit(importlib.util.decode_source(ctx.source), multi=True)
+        except (SyntaxError, ValueError) as e:
+            print(f"⚠️  Error analyzing maintainability of {ctx.path}: {e}")
+            return issues
+        
+        if mi_score < self.min_maintainability_index:
+            issues.append(self._maintainability_issue(
+                ctx.rel_path, mi_score, mi_rank(mi_score)
+            ))
         
         return issues
     
-    def _get_nesting_depth(self, node: ast.AST, current_depth: int = 0) -> int:
-        """Calculate nesting depth for control flow structures"""
-        max_depth = current_depth
-        
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.If, ast.For, ast.While)):
-                child_depth = self._get_nesting_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
+    def _maintainability_issue(self, rel_path: str, mi_score: float, rank: str) -> AnalysisIssue:
+        """Build a maintainability issue for one file"""
+        severity = 'critical' if mi_score < 20 else 'high' if mi_score < 40 else 'medium'
         
-        return max_depth
+        return AnalysisIssue(
+            severity=severity,
+            category='maintainability',
+            title=f"Low maintainability: {mi_score:.1f}",
+            description=f"File has maintainability index {mi_score:.1f}, threshold is {self.min_maintainability_index}",
+            file=rel_path,
+            line=1,
+            end_line=1,
+            suggested_refactoring='comprehensive_refactoring',
+            automated=False,
+            risk='high',
+            impact='high',
+            metrics={'maintainability_index': mi_score, 'rank': rank}
+        )
     
-    def _analyze_maintainability(self, files: List[Path]) -> List[AnalysisIssue]:
-        """Analyze maintainability index using Radon"""
+    def _analyze_radon_cli(self, radon: str, files: List[Path]) -> List[AnalysisIssue]:
+        """Fallback for a CLI-only radon install: one `radon cc`/`radon mi` run per batch of files"""
         issues = []
+        max_complexity = self.max_complexity
+        min_mi = self.min_maintainability_index
         
-        for file in files:
-            try:
-                result = subprocess.run(
-                    ['radon', 'mi', str(file), '-s', '-j'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
+        for start in range(0, len(files), _RADON_BATCH_SIZE):
+            batch = [str(f) for f in files[start:start + _RADON_BATCH_SIZE]]
+            
+            for path, blocks in self._run_radon_cli(radon, 'cc', batch).items():
+                # Files radon failed to parse are reported as {"error": ...}
+                if not isinstance(blocks, list):
                     continue
-                
-                data = json.loads(result.stdout)
-                
-                for item in data.get(str(file), []):
-                    mi_score = item.get('mi', 100)
-                    
-                    if mi_score < self.config.get('min_maintainability_index', 65):
-                        severity = 'critical' if mi_score < 20 else 'high' if mi_score < 40 else 'medium'
-                        
-                        issues.append(AnalysisIssue(
-                            severity=severity,
-                            category='maintainability',
-                            title=f"Low maintainability: {mi_score:.1f}",
-                            description=f"File has maintainability index {mi_score:.1f}, threshold is {self.config.get('min_maintainability_index', 65)}",
-                            file=str(file.relative_to(self.project_path)),
-                            line=1,
-                            end_line=1,
-                            suggested_refactoring='comprehensive_refactoring',
-                            automated=False,
-                            risk='high',
-                            impact='high',
-                            metrics={'maintainability_index': mi_score, 'rank': item.get('rank', 'C')}
+                rel_path = str(Path(path).relative_to(self.project_path))
+                for item in blocks:
+                    if item.get('complexity', 0) > max_complexity:
+                        issues.append(self._complexity_issue(
+                            rel_path, item.get('name', 'unknown'), item['complexity'],
+                            item.get('lineno', 0), item.get('endline', 0), item.get('type', 'function')
                         ))
             
-            except Exception as e:
-                print(f"⚠️  Error analyzing maintainability of {file}: {e}")
+            for path, item in self._run_radon_cli(radon, 'mi', batch).items():
+                if not isinstance(item, dict) or 'mi' not in item:
+                    continue
+                if item['mi'] < min_mi:
+                    issues.append(self._maintainability_issue(
+                        str(Path(path).relative_to(self.project_path)), item['mi'], item.get('rank', '')
+                    ))
         
         return issues
     
+    def _run_radon_cli(self, radon: str, command: str, paths: List[str]) -> Dict[str, Any]:
+        """Run one radon subcommand over many files and return its JSON output keyed by path"""
+        try:
+            result = subprocess.run(
+                [radon, command, '-s', '-j', *paths],
+                capture_output=True,
+                text=True
+            )
+            return json.loads(result.stdout) if result.stdout else {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  radon {command} failed: {e}")
+            return {}
+    
     def _generate_report(self) -> Dict[str, Any]:
         """Generate final analysis report"""
-        # Sort issues by priority
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        self.issues.sort(key=lambda x: (priority_order[x.severity], x.file, x.line))
+        # Sort issues by priority (C-level key extraction, no per-issue lambda)
+        self.issues.sort(key=attrgetter('severity_idx', 'file', 'line'))
         
         # Calculate summary statistics
-        severity_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        category_counts = {}
-        automated_count = 0
+        severity_counts = dict.fromkeys(_SEVERITY_ORDER, 0)
+        severity_counts.update(Counter(issue.severity for issue in self.issues))
+        category_counts = dict(Counter(issue.category for issue in self.issues))
+        automated_count = sum(1 for issue in self.issues if issue.automated)
         
-        for issue in self.issues:
-            severity_counts[issue.severity] += 1
-            category_counts[issue.category] = category_counts.get(issue.category, 0) + 1
-            if issue.automated:
-                automated_count += 1
+        summary = {
+            "total_issues": len(self.issues),
+            "by_severity": severity_counts,
+            "by_category": category_counts,
+            "automated_count": automated_count,
+            "manual_count": len(self.issues) - automated_count
+        }
         
         report = {
             "project_path": str(self.project_path),
             "analysis_version": "1.0.0",
-            "summary": {
-                "total_issues": len(self.issues),
-                "by_severity": severity_counts,
-                "by_category": category_counts,
-                "automated_count": automated_count,
-                "manual_count": len(self.issues) - automated_count
-            },
+            "summary": summary,
             "metrics": self.metrics,
-            "issues": [asdict(issue) for issue in self.issues],
-            "recommendations": self._generate_recommendations()
+            "issues": [issue.to_dict() for issue in self.issues],
+            "recommendations": self._generate_recommendations(summary)
         }
         
         return report
     
-    def _generate_recommendations(self) -> List[str]:
-        """Generate high-level recommendations"""
+    def _generate_recommendations(self, summary: Dict[str, Any]) -> List[str]:
+        """Generate high-level recommendations from the already-computed summary counts"""
         recommendations = []
         
-        critical_count = sum(1 for i in self.issues if i.severity == 'critical')
+        critical_count = summary['by_severity']['critical']
         if critical_count > 0:
             recommendations.append(f"Address {critical_count} critical issues immediately - these represent major technical debt")
         
-        complexity_issues = [i for i in self.issues if i.category == 'complexity']
-        if len(complexity_issues) > 10:
-            recommendations.append(f"Focus on complexity reduction - {len(complexity_issues)} functions need simplification")
+        complexity_count = summary['by_category'].get('complexity', 0)
+        if complexity_count > 10:
+            recommendations.append(f"Focus on complexity reduction - {complexity_count} functions need simplification")
         
-        automated_issues = [i for i in self.issues if i.automated]
-        if len(automated_issues) > 0:
-            recommendations.append(f"Run automated refactoring on {len(automated_issues)} issues that can be safely automated")
+        automated_count = summary['automated_count']
+        if automated_count > 0:
+            recommendations.append(f"Run automated refactoring on {automated_count} issues that can be safely automated")
         
         return recommendations
 
 
+def _analyze_one(file: Path, project_path: Path, config: Dict[str, Any], use_cache: bool) -> Tuple[List[AnalysisIssue], int]:
+    """Analyze a single file; module-level so ProcessPoolExecutor workers can pickle it"""
+    try:
+        return PythonAnalyzer(project_path, config, jobs=1, use_cache=use_cache)._analyze_file(file)
+    except Exception as e:
+        # One pathological file (e.g. RecursionError/MemoryError from ast.parse or radon) must not abort the run
+        print(f"⚠️  Error analyzing {file}: {type(e).__name__}: {e}")
+        return [], 0
+
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze Python project for refactoring opportunities')
     parser.add_argument('project_path', help='Path to the Python project')
@@ -374,6 +593,10 @@ def main():
                        help='Maximum allowed class length in lines')
     parser.add_argument('--min-maintainability', type=int, default=65,
                        help='Minimum maintainability index')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count(),
+                       help='Number of worker processes (default: CPU count, 1 = no multiprocessing)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not write the .refactoring-cache directory')
     
     args = parser.parse_args()
     
@@ -384,15 +607,25 @@ def main():
         'min_maintainability_index': args.min_maintainability
     }
     
-    analyzer = PythonAnalyzer(args.project_path, config)
+    analyzer = PythonAnalyzer(args.project_path, config, jobs=args.jobs, use_cache=not args.no_cache)
     report = analyzer.analyze()
     
     # Write report
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    if orjson is not None:
+        # Native serializer; much faster than json.dump on reports with thousands of issues
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\n✅ Analysis complete!")
     print(f"📊 Found {report['summary']['total_issues']} issues")
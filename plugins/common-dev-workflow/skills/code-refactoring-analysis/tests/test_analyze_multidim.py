@@ -0,0 +1,216 @@
+"""Tests for analyze_multidim.py; run with python -m unittest discover from the skill directory."""
+
+import ast
+import contextlib
+import io
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from analyze_multidim import _CACHE_DB, MultiDimensionalAnalyzer, _hash_blocks  # noqa: E402
+
+_BODY = [
+    "def load_users(session, limit):",
+    "    query = session.query(User).filter(User.active == True)",
+    "    query = query.order_by(User.created_at.desc())",
+    "    rows = query.limit(limit).all()",
+    "    return [row.to_dict() for row in rows]",
+    "    # trailing comment keeps the block long enough",
+]
+
+
+def _baseline_duplicates(project: Path, files, block_size=5):
+    """Duplicate blocks as the original whitespace-normalized, joined-text comparison reported them"""
+    duplicates = []
+    blocks = {}
+    for path in files:
+        lines = path.read_text(encoding='utf-8').splitlines(keepends=True)
+        relative_path = str(path.relative_to(project))
+        for i in range(len(lines) - block_size + 1):
+            normalized = ' '.join(''.join(lines[i:i + block_size]).split())
+            if len(normalized) < 50:
+                continue
+            if normalized in blocks:
+                for existing in blocks[normalized]:
+                    if existing['file'] != relative_path or abs(existing['line'] - (i + 1)) > block_size:
+                        duplicates.append({
+                            'file': relative_path,
+                            'line': i + 1,
+                            'similar_to': existing['file'],
+                            'similar_line': existing['line'],
+                            'message': f'Similar code block ({block_size} lines)',
+                            'source': 'hash_detection'
+                        })
+                        break
+            else:
+                blocks[normalized] = []
+            blocks[normalized].append({'file': relative_path, 'line': i + 1})
+    return duplicates[:50]
+
+
+def _elif_chain(indent, branches):
+    pad = ' ' * indent
+    lines = []
+    for i in range(branches):
+        lines.append(f"{pad}{'if' if i == 0 else 'elif'} kind == {i}:")
+        lines.append(f"{pad}    return {i}")
+    return lines
+
+
+# A deep chain before a shallower one, and a long chain only inside a nested function
+_OCP_SOURCE = '\n'.join(
+    ['def outer(kind, rows):', '    for row in rows:', '        if row:']
+    + _elif_chain(12, 5)
+    + _elif_chain(4, 6)
+    + ['', '', 'def wrapper(kind):', '    def inner(kind):']
+    + _elif_chain(8, 5)
+    + ['    return inner', '']
+)
+
+
+def _baseline_ocp(source):
+    """(function, line) pairs as the original ast.walk-per-function search reported them"""
+    found = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.FunctionDef):
+            for child in ast.walk(node):
+                if isinstance(child, ast.If):
+                    current, chain_length = child, 1
+                    while len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If):
+                        chain_length += 1
+                        current = current.orelse[0]
+                    if chain_length >= 5:
+                        found.append((node.name, child.lineno))
+                        break
+    return found
+
+
+class DuplicateBlockTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, lines):
+        path = self.project / name
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return path
+
+    def test_blank_lines_between_blocks_match_baseline(self):
+        files = [
+            self._write('a.py', _BODY),
+            # Same statements with blank lines in different places, and between repeated blocks
+            self._write('b.py', _BODY[:2] + [''] + _BODY[2:] + ['', ''] + _BODY),
+            self._write('c.py', [''] + _BODY[:3] + ['', '   ', ''] + _BODY[3:] + [''] + _BODY[:4]),
+        ]
+        analyzer = MultiDimensionalAnalyzer(str(self.project), ['reusability'], use_cache=False)
+
+        found = analyzer._detect_duplicates_with_hashing(files)
+
+        self.assertTrue(found)
+        self.assertEqual(found, _baseline_duplicates(self.project, files))
+
+    def test_undecodable_byte_only_affects_its_line(self):
+        path = self.project / 'latin1.py'
+        path.write_bytes(('\n'.join(_BODY) + '\n').encode('utf-8') + b'name = "caf\xe9"\n')
+
+        blocks = _hash_blocks(path, self.project)
+
+        self.assertEqual([line for _, _, line in blocks], [1, 2, 3])
+
+
+class OcpViolationTest(unittest.TestCase):
+    def test_chains_and_functions_match_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / 'ocp.py').write_text(_OCP_SOURCE, encoding='utf-8')
+            analyzer = MultiDimensionalAnalyzer(str(project), ['scalability'], use_cache=False)
+
+            found = analyzer._find_ocp_violations([project / 'ocp.py'])
+
+        self.assertEqual([(v.function, v.line) for v in found], _baseline_ocp(_OCP_SOURCE))
+        self.assertEqual([v.function for v in found], ['outer', 'wrapper', 'inner'])
+
+
+_COUPLED_SOURCE = """
+class Service:
+    def __init__(self, mode):
+        try:
+            self.a = Alpha()
+            self.b = Beta()
+        except* ValueError:
+            self.c = Gamma()
+        match mode:
+            case 'fast':
+                self.d = Delta()
+            case _:
+                self.e = Epsilon()
+                self.f = Zeta()
+"""
+
+
+class TightCouplingTest(unittest.TestCase):
+    def test_calls_in_try_star_and_match_arms_are_counted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / 'service.py').write_text(_COUPLED_SOURCE, encoding='utf-8')
+            analyzer = MultiDimensionalAnalyzer(str(project), ['scalability'], use_cache=False)
+
+            found = analyzer._find_tight_coupling([project / 'service.py'])
+
+        self.assertEqual([(f.class_name, f.instantiations) for f in found], [('Service', 6)])
+
+
+class FactsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        methods = ''.join(f'    def m{i}(self, rows):\n        for a in rows:\n            for b in a:\n                print(b)\n'
+                          for i in range(22))
+        (self.project / 'big.py').write_text('import os\n\n\nclass Big:\n' + methods, encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _facts(self):
+        analyzer = MultiDimensionalAnalyzer(str(self.project), ['performance', 'scalability'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            return analyzer._collect_file_facts()
+
+    def test_cached_facts_round_trip_as_json(self):
+        first = self._facts()
+        second = self._facts()
+
+        self.assertEqual(second, first)
+        self.assertTrue(second[0].god_classes)
+        with contextlib.closing(sqlite3.connect(str(self.project / _CACHE_DB))) as conn:
+            (stored,) = conn.execute('SELECT facts FROM facts').fetchone()
+        self.assertIsInstance(stored, str)
+
+    def test_malformed_entry_is_reparsed(self):
+        first = self._facts()
+        with contextlib.closing(sqlite3.connect(str(self.project / _CACHE_DB))) as conn, conn:
+            conn.execute("UPDATE facts SET facts = '{\"relative_path\": 1}'")
+
+        self.assertEqual(self._facts(), first)
+
+    def test_since_still_rehashes_files_git_reports_unchanged(self):
+        self._facts()
+        (self.project / 'big.py').write_text('class Small:\n    pass\n', encoding='utf-8')
+        analyzer = MultiDimensionalAnalyzer(str(self.project), ['performance', 'scalability'])
+        # As if git reported nothing changed since the ref
+        analyzer._changed = set()
+
+        facts = analyzer._collect_file_facts()
+
+        self.assertEqual(facts[0].god_classes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for analyze_python.py; run with python -m unittest discover from the skill directory."""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from analyze_python import PythonAnalyzer, _analyze_one  # noqa: E402
+
+_LONG_FUNCTION = ['def busy(x):'] + [f'    x = x + {i}' for i in range(60)] + ['    return x']
+
+
+class PerFileErrorTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        (self.project / 'good.py').write_text('\n'.join(_LONG_FUNCTION) + '\n', encoding='utf-8')
+        # Parses fine token-wise but overflows the AST builder's recursion limit
+        (self.project / 'deep.py').write_text('x = ' + '+1' * 200000 + '\n', encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _analyze(self, use_cache=False):
+        analyzer = PythonAnalyzer(str(self.project), {'max_method_length': 50}, jobs=1, use_cache=use_cache)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            analyzer.analyze()
+        return analyzer, output.getvalue()
+
+    def test_recursion_error_skips_only_that_file(self):
+        analyzer, output = self._analyze()
+
+        self.assertIn('deep.py: RecursionError', output)
+        self.assertEqual({issue.file for issue in analyzer.issues}, {'good.py'})
+
+    def test_worker_returns_empty_result_on_error(self):
+        result = _analyze_one(self.project / 'deep.py', self.project, {}, False)
+
+        self.assertEqual(result, ([], 0))
+
+    def test_stale_issue_cache_entries_are_recomputed(self):
+        (self.project / 'deep.py').unlink()
+        first, _ = self._analyze(use_cache=True)
+        for cache_file in (self.project / '.refactoring-cache').rglob('*.json'):
+            cache_file.write_text(json.dumps([{'severity': 'low', 'removed_field': 1}]), encoding='utf-8')
+
+        second, _ = self._analyze(use_cache=True)
+
+        self.assertTrue(first.issues)
+        self.assertEqual(second.issues, first.issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
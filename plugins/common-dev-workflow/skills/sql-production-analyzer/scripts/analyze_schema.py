@@ -4,12 +4,119 @@ Analyze database schema for production readiness.
 Supports multiple schema definition formats.
 """
 
+import os
 import re
 import json
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
+# orjson serializes large reports several times faster than json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Schema definition patterns, compiled once instead of per file / per model. They run over
+# memory-mapped file bytes; only the captured names and definitions are decoded
+_PRISMA_MODEL_RE = re.compile(rb'model\s+(\w+)\s*\{([^}]+)\}')
+_PRISMA_INDEX_RE = re.compile(r'@@index\(\[([^\]]+)\]')
+_CREATE_TABLE_RE = re.compile(
+    rb'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(([^;]+)\)', re.IGNORECASE | re.DOTALL
+)
+_CREATE_INDEX_RE = re.compile(rb'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*\(([^)]+)\)', re.IGNORECASE)
+_ENTITY_RE = re.compile(rb'@Entity\([\'"]?(\w+)?[\'"]?\)')
+_ENTITY_COLUMN_RE = re.compile(rb'@Column\(([^)]*)\)[\s\n]+(\w+):')
+_SA_CLASS_RE = re.compile(rb'class\s+(\w+)\([^)]*\):\s*\n\s*__tablename__\s*=\s*[\'"](\w+)[\'"]')
+_SA_COLUMN_RE = re.compile(rb'(\w+)\s*=\s*Column\(')
+# Start of the next top-level class, which ends the body of the model before it
+_TOP_LEVEL_CLASS_RE = re.compile(rb'^class\s', re.MULTILINE)
+
+# Parentheses and commas: column lists are split only at commas outside any parentheses
+_SQL_SPLIT_RE = re.compile(r'[(),]')
+# Column name and type, the type's parenthesised arguments included even when spaced: numeric(8, 2)
+_SQL_COLUMN_DEF_RE = re.compile(r'(\S+)\s+([^\s(]+(?:\s*\([^)]*\))?)')
+
+# Case-insensitive literal gate for SQL files: without a CREATE there is no table or index to find
+_SQL_CREATE_RE = re.compile(rb'CREATE', re.IGNORECASE)
+
+# Issue severities. String literals are already shared constants in CPython, so these exist to keep
+# the checks and the report order spelled alike rather than to save memory
+_SEV_CRITICAL = 'CRITICAL'
+_SEV_HIGH = 'HIGH'
+_SEV_MEDIUM = 'MEDIUM'
+_SEV_LOW = 'LOW'
+
+# Report order for issues, most severe first; unknown severities sort last
+_SEVERITY_ORDER = {_SEV_CRITICAL: 0, _SEV_HIGH: 1, _SEV_MEDIUM: 2, _SEV_LOW: 3}
+
+
+@contextmanager
+def _mapped(path: Path):
+    """Read-only mmap of a file for the duration of the block; b'' for empty files, which cannot be mapped"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
+
+
+# Below this many files, process-pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+
+@dataclass(slots=True)
+class SchemaIssue:
+    """One finding; slotted, as large schemas produce many and a dict per issue costs several times more"""
+    severity: str
+    type: str
+    table: str
+    column: Optional[str] = field(default=None, kw_only=True)
+    message: str
+    file: str
+    
+    def to_dict(self) -> Dict:
+        """Report form, in field order; column only appears on the issues that name one"""
+        return asdict(self, dict_factory=lambda items: {k: v for k, v in items if v is not None})
+
+
+def _split_top_level(columns_def: str) -> List[str]:
+    """Comma-separated parts of a column list, keeping DECIMAL(10,2) or PRIMARY KEY (a, b) in one piece"""
+    parts = []
+    depth = 0
+    start = 0
+    for match in _SQL_SPLIT_RE.finditer(columns_def):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            parts.append(columns_def[start:match.start()])
+            start = match.end()
+    parts.append(columns_def[start:])
+    return parts
+
+
+def _is_key_column(name: str) -> bool:
+    """id, user_id, userId or userID; not words that merely end in "id" such as uuid, paid or valid"""
+    lower = name.lower()
+    if lower == 'id' or lower.endswith('_id'):
+        return True
+    # camelCase: the Id/ID suffix must follow a lowercase letter, which rules out UUID and VALID
+    return name.endswith(('Id', 'ID')) and name[-3:-2].islower()
+
+
+def _parse_schema_file(parser: str, path: Path, project_root: Path) -> Tuple[list, list]:
+    """Run one per-file parser; module-level so ProcessPoolExecutor workers can pickle it"""
+    return getattr(SchemaAnalyzer(str(project_root)), parser)(path)
+
 
 class SchemaAnalyzer:
     def __init__(self, project_path: str):
@@ -36,29 +143,36 @@ class SchemaAnalyzer:
     
     def find_prisma_schema(self):
         """Parse Prisma schema files"""
-        for schema_file in self.project_path.rglob('schema.prisma'):
-            with open(schema_file, 'r') as f:
-                content = f.read()
+        schema_files = list(self.project_path.rglob('schema.prisma'))
+        self._merge(self._parse_files('_prisma_file_schema', schema_files))
+    
+    def _prisma_file_schema(self, schema_file: Path) -> Tuple[list, list]:
+        """(tables, indexes) defined in one Prisma schema file"""
+        tables, indexes = [], []
+        with _mapped(schema_file) as content:
+            # Plain substring search is far cheaper than the model regex on files without models
+            if content.find(b'model') == -1:
+                return tables, indexes
+            source = str(schema_file.relative_to(self.project_path))
             
             # Extract models
-            model_pattern = r'model\s+(\w+)\s*\{([^}]+)\}'
-            for match in re.finditer(model_pattern, content):
-                table_name = match.group(1)
-                fields = match.group(2)
+            for match in _PRISMA_MODEL_RE.finditer(content):
+                table_name = match.group(1).decode()
+                fields = match.group(2).decode('utf-8', 'replace')
                 
-                self.tables[table_name] = {
-                    'source': str(schema_file.relative_to(self.project_path)),
+                tables.append((table_name, {
+                    'source': source,
                     'columns': self.parse_prisma_fields(fields),
-                }
+                }))
                 
                 # Extract indexes
-                index_pattern = r'@@index\(\[([^\]]+)\]'
-                for idx_match in re.finditer(index_pattern, fields):
+                for idx_match in _PRISMA_INDEX_RE.finditer(fields):
                     columns = [c.strip() for c in idx_match.group(1).split(',')]
-                    self.indexes[table_name].append({
+                    indexes.append((table_name, {
                         'columns': columns,
                         'type': 'index'
-                    })
+                    }))
+        return tables, indexes
     
     def parse_prisma_fields(self, fields_text: str) -> List[Dict]:
         """Parse Prisma field definitions"""
@@ -86,60 +200,69 @@ class SchemaAnalyzer:
         """Parse SQL migration files"""
         migration_dirs = ['migrations', 'db/migrate', 'alembic/versions']
         
+        sql_files = []
         for dir_name in migration_dirs:
             migration_path = self.project_path / dir_name
             if not migration_path.exists():
                 continue
             
-            for sql_file in migration_path.rglob('*.sql'):
-                self.parse_sql_file(sql_file)
+            sql_files.extend(migration_path.rglob('*.sql'))
+        
+        # The first definition of a table wins, as migrations only ever add to it
+        self._merge(self._parse_files('_sql_file_schema', sql_files), overwrite=False)
     
     def parse_sql_file(self, sql_file: Path):
         """Extract table definitions from SQL"""
-        with open(sql_file, 'r') as f:
-            content = f.read()
-        
-        # Extract CREATE TABLE statements
-        create_table_pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(([^;]+)\)'
-        for match in re.finditer(create_table_pattern, content, re.IGNORECASE | re.DOTALL):
-            table_name = match.group(1)
-            columns_def = match.group(2)
+        self._merge([self._sql_file_schema(sql_file)], overwrite=False)
+    
+    def _sql_file_schema(self, sql_file: Path) -> Tuple[list, list]:
+        """(tables, indexes) created by one SQL file"""
+        tables, indexes = [], []
+        with _mapped(sql_file) as content:
+            if _SQL_CREATE_RE.search(content) is None:
+                return tables, indexes
+            source = str(sql_file.relative_to(self.project_path))
             
-            if table_name not in self.tables:
-                self.tables[table_name] = {
-                    'source': str(sql_file.relative_to(self.project_path)),
+            # Extract CREATE TABLE statements
+            for match in _CREATE_TABLE_RE.finditer(content):
+                table_name = match.group(1).decode()
+                columns_def = match.group(2).decode('utf-8', 'replace')
+                
+                tables.append((table_name, {
+                    'source': source,
                     'columns': self.parse_sql_columns(columns_def),
-                }
-        
-        # Extract CREATE INDEX statements
-        index_pattern = r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*\(([^)]+)\)'
-        for match in re.finditer(index_pattern, content, re.IGNORECASE):
-            index_name = match.group(1)
-            table_name = match.group(2)
-            columns = [c.strip() for c in match.group(3).split(',')]
+                }))
             
-            self.indexes[table_name].append({
-                'name': index_name,
-                'columns': columns,
-                'type': 'UNIQUE' if 'UNIQUE' in match.group(0).upper() else 'INDEX'
-            })
+            # Extract CREATE INDEX statements
+            for match in _CREATE_INDEX_RE.finditer(content):
+                index_name = match.group(1).decode()
+                table_name = match.group(2).decode()
+                columns = [c.strip() for c in match.group(3).decode('utf-8', 'replace').split(',')]
+                
+                indexes.append((table_name, {
+                    'name': index_name,
+                    'columns': columns,
+                    'type': 'UNIQUE' if b'UNIQUE' in match.group(0).upper() else 'INDEX'
+                }))
+        return tables, indexes
     
     def parse_sql_columns(self, columns_def: str) -> List[Dict]:
         """Parse SQL column definitions"""
         columns = []
-        for line in columns_def.split(','):
+        for line in _split_top_level(columns_def):
             line = line.strip()
-            if not line or line.upper().startswith(('PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK', 'CONSTRAINT')):
+            upper = line.upper()
+            if not line or upper.startswith(('PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK', 'CONSTRAINT')):
                 continue
             
-            parts = line.split()
-            if len(parts) >= 2:
+            definition = _SQL_COLUMN_DEF_RE.match(line)
+            if definition:
                 col = {
-                    'name': parts[0],
-                    'type': parts[1],
-                    'nullable': 'NOT NULL' not in line.upper(),
-                    'primary': 'PRIMARY KEY' in line.upper(),
-                    'unique': 'UNIQUE' in line.upper(),
+                    'name': definition.group(1),
+                    'type': definition.group(2),
+                    'nullable': 'NOT NULL' not in upper,
+                    'primary': 'PRIMARY KEY' in upper,
+                    'unique': 'UNIQUE' in upper,
                 }
                 columns.append(col)
         
@@ -147,57 +270,87 @@ class SchemaAnalyzer:
     
     def find_typeorm_entities(self):
         """Find TypeORM entity files"""
-        for entity_file in self.project_path.rglob('*.entity.ts'):
-            with open(entity_file, 'r') as f:
-                content = f.read()
+        entity_files = list(self.project_path.rglob('*.entity.ts'))
+        self._merge(self._parse_files('_typeorm_file_schema', entity_files))
+    
+    def _typeorm_file_schema(self, entity_file: Path) -> Tuple[list, list]:
+        """(tables, indexes) declared by one TypeORM entity file"""
+        tables = []
+        with _mapped(entity_file) as content:
+            if content.find(b'@Entity') == -1:
+                return tables, []
             
             # Extract @Entity decorator
-            entity_pattern = r'@Entity\([\'"]?(\w+)?[\'"]?\)'
-            entity_match = re.search(entity_pattern, content)
+            entity_match = _ENTITY_RE.search(content)
             if entity_match:
-                table_name = entity_match.group(1) or entity_file.stem.replace('.entity', '')
+                entity_name = entity_match.group(1)
+                table_name = entity_name.decode() if entity_name else entity_file.stem.replace('.entity', '')
                 
                 # Extract @Column decorators
                 columns = []
-                column_pattern = r'@Column\(([^)]*)\)[\s\n]+(\w+):'
-                for col_match in re.finditer(column_pattern, content):
-                    col_name = col_match.group(2)
+                for col_match in _ENTITY_COLUMN_RE.finditer(content):
+                    col_name = col_match.group(2).decode()
                     columns.append({'name': col_name, 'type': 'unknown'})
                 
-                self.tables[table_name] = {
+                tables.append((table_name, {
                     'source': str(entity_file.relative_to(self.project_path)),
                     'columns': columns,
-                }
+                }))
+        return tables, []
     
     def find_sqlalchemy_models(self):
         """Find SQLAlchemy model files"""
-        for py_file in self.project_path.rglob('*.py'):
-            try:
-                with open(py_file, 'r') as f:
-                    content = f.read()
-                
-                # Look for SQLAlchemy models
-                if 'Base' not in content or 'Column' not in content:
-                    continue
+        py_files = list(self.project_path.rglob('*.py'))
+        self._merge(self._parse_files('_sqlalchemy_file_schema', py_files))
+    
+    def _sqlalchemy_file_schema(self, py_file: Path) -> Tuple[list, list]:
+        """(tables, indexes) mapped by one SQLAlchemy models file; unreadable files yield nothing"""
+        tables = []
+        try:
+            with _mapped(py_file) as content:
+                # Look for SQLAlchemy models; every model match needs a __tablename__ as well
+                if (content.find(b'Base') == -1 or content.find(b'Column') == -1
+                        or content.find(b'__tablename__') == -1):
+                    return tables, []
+                source = str(py_file.relative_to(self.project_path))
                 
                 # Extract table definitions
-                class_pattern = r'class\s+(\w+)\([^)]*\):\s*\n\s*__tablename__\s*=\s*[\'"](\w+)[\'"]'
-                for match in re.finditer(class_pattern, content):
-                    class_name = match.group(1)
-                    table_name = match.group(2)
+                for match in _SA_CLASS_RE.finditer(content):
+                    class_name = match.group(1).decode()
+                    table_name = match.group(2).decode()
                     
-                    # Find columns in this class
+                    # Find columns in this class only: scan from its header to the next top-level class
+                    next_class = _TOP_LEVEL_CLASS_RE.search(content, match.end())
+                    body_end = next_class.start() if next_class else len(content)
                     columns = []
-                    column_pattern = r'(\w+)\s*=\s*Column\('
-                    for col_match in re.finditer(column_pattern, content):
-                        columns.append({'name': col_match.group(1), 'type': 'unknown'})
+                    for col_match in _SA_COLUMN_RE.finditer(content, match.end(), body_end):
+                        columns.append({'name': col_match.group(1).decode(), 'type': 'unknown'})
                     
-                    self.tables[table_name] = {
-                        'source': str(py_file.relative_to(self.project_path)),
+                    tables.append((table_name, {
+                        'source': source,
                         'columns': columns,
-                    }
-            except:
-                continue
+                    }))
+        except:
+            return [], []
+        return tables, []
+    
+    def _parse_files(self, parser: str, files: List[Path]) -> List[Tuple[list, list]]:
+        """Run a per-file parser over files, in order; files are independent, so larger sets use every core"""
+        if len(files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(
+                    _parse_schema_file, repeat(parser), files, repeat(self.project_path), chunksize=32
+                ))
+        return [getattr(self, parser)(path) for path in files]
+    
+    def _merge(self, results: List[Tuple[list, list]], overwrite: bool = True):
+        """Fold per-file (tables, indexes) results into the analyzer in file order"""
+        for tables, indexes in results:
+            for table_name, table_info in tables:
+                if overwrite or table_name not in self.tables:
+                    self.tables[table_name] = table_info
+            for table_name, index in indexes:
+                self.indexes[table_name].append(index)
     
     def check_indexes(self):
         """Check for missing or redundant indexes"""
@@ -207,65 +360,73 @@ class SchemaAnalyzer:
             
             # Check for tables without any indexes
             if not indexes and len(columns) > 2:
-                self.issues.append({
-                    'severity': 'MEDIUM',
-                    'type': 'missing_indexes',
-                    'table': table_name,
-                    'message': f'Table {table_name} has no indexes defined',
-                    'file': table_info['source']
-                })
+                self.issues.append(SchemaIssue(
+                    severity=_SEV_MEDIUM,
+                    type='missing_indexes',
+                    table=table_name,
+                    message=f'Table {table_name} has no indexes defined',
+                    file=table_info['source']
+                ))
             
-            # Check for duplicate indexes
-            index_cols = [tuple(idx['columns']) for idx in indexes]
-            if len(index_cols) != len(set(index_cols)):
-                self.issues.append({
-                    'severity': 'LOW',
-                    'type': 'duplicate_index',
-                    'table': table_name,
-                    'message': f'Table {table_name} has duplicate indexes',
-                    'file': table_info['source']
-                })
+            # Check for duplicate indexes, stopping at the first column list seen twice
+            seen = set()
+            for idx in indexes:
+                index_cols = tuple(idx['columns'])
+                if index_cols in seen:
+                    self.issues.append(SchemaIssue(
+                        severity=_SEV_LOW,
+                        type='duplicate_index',
+                        table=table_name,
+                        message=f'Table {table_name} has duplicate indexes',
+                        file=table_info['source']
+                    ))
+                    break
+                seen.add(index_cols)
     
     def check_foreign_keys(self):
         """Check foreign key definitions"""
         for table_name, table_info in self.tables.items():
             columns = table_info['columns']
             
+            # Every column covered by any of the table's indexes, built once per table
+            indexed = set()
+            for idx in self.indexes.get(table_name, ()):
+                indexed.update(idx['columns'])
+            
             # Look for columns that look like foreign keys but aren't defined
             for col in columns:
-                col_name = col['name'].lower()
-                if col_name.endswith('_id') or col_name.endswith('id'):
+                if _is_key_column(col['name']):
                     # Should have a foreign key or index
-                    has_index = any(
-                        col['name'] in idx['columns'] 
-                        for idx in self.indexes.get(table_name, [])
-                    )
+                    has_index = col['name'] in indexed
                     
                     if not has_index:
-                        self.issues.append({
-                            'severity': 'HIGH',
-                            'type': 'missing_fk_index',
-                            'table': table_name,
-                            'column': col['name'],
-                            'message': f'Foreign key column {col["name"]} in {table_name} lacks an index',
-                            'file': table_info['source']
-                        })
+                        self.issues.append(SchemaIssue(
+                            severity=_SEV_HIGH,
+                            type='missing_fk_index',
+                            table=table_name,
+                            column=col['name'],
+                            message=f'Foreign key column {col["name"]} in {table_name} lacks an index',
+                            file=table_info['source']
+                        ))
     
     def check_constraints(self):
         """Check for missing constraints"""
         for table_name, table_info in self.tables.items():
             columns = table_info['columns']
             
-            # Check for primary keys
-            has_pk = any(col.get('primary') for col in columns)
-            if not has_pk and 'id' in [col['name'] for col in columns]:
-                self.issues.append({
-                    'severity': 'CRITICAL',
-                    'type': 'missing_primary_key',
-                    'table': table_name,
-                    'message': f'Table {table_name} may be missing primary key constraint',
-                    'file': table_info['source']
-                })
+            # Check for primary keys: one pass notes both a primary column and a column named id
+            has_pk = has_id = False
+            for col in columns:
+                has_pk = has_pk or bool(col.get('primary'))
+                has_id = has_id or col['name'] == 'id'
+            if not has_pk and has_id:
+                self.issues.append(SchemaIssue(
+                    severity=_SEV_CRITICAL,
+                    type='missing_primary_key',
+                    table=table_name,
+                    message=f'Table {table_name} may be missing primary key constraint',
+                    file=table_info['source']
+                ))
     
     def generate_report(self) -> Dict:
         """Generate analysis report"""
@@ -277,7 +438,10 @@ class SchemaAnalyzer:
             },
             'tables': self.tables,
             'indexes': dict(self.indexes),
-            'issues': sorted(self.issues, key=lambda x: {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}[x['severity']])
+            'issues': [
+                issue.to_dict()
+                for issue in sorted(self.issues, key=lambda x: _SEVERITY_ORDER.get(x.severity, len(_SEVERITY_ORDER)))
+            ]
         }
 
 
@@ -296,8 +460,11 @@ def main():
     
     # Save report
     output_file = 'schema_analysis.json'
-    with open(output_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\nAnalysis complete!")
     print(f"Tables found: {report['summary']['tables_found']}")
@@ -306,7 +473,7 @@ def main():
     print(f"\nDetailed report saved to {output_file}")
     
     # Print critical issues
-    critical = [i for i in report['issues'] if i['severity'] == 'CRITICAL']
+    critical = [i for i in report['issues'] if i['severity'] == _SEV_CRITICAL]
     if critical:
         print(f"\n⚠️  {len(critical)} CRITICAL issues found:")
         for issue in critical:
@@ -6,13 +6,44 @@ to detect mismatches after DB changes.
 """
 
 import re
+import os
 import json
 import sys
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from urllib.parse import urlparse
 
 
+# Table references in raw SQL, matched on file bytes: source trees are scanned undecoded and the
+# case-insensitive match skips Unicode case folding. A name runs over ASCII word characters and UTF-8
+# multibyte sequences; its decoded \w prefix is the name the same pattern finds on text
+_RAW_SQL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        rb'SELECT\s+.+?\s+FROM\s+[`"\']?([\w\x80-\xff]+)[`"\']?',
+        rb'INSERT\s+INTO\s+[`"\']?([\w\x80-\xff]+)[`"\']?',
+        rb'UPDATE\s+[`"\']?([\w\x80-\xff]+)[`"\']?',
+        rb'DELETE\s+FROM\s+[`"\']?([\w\x80-\xff]+)[`"\']?',
+        rb'JOIN\s+[`"\']?([\w\x80-\xff]+)[`"\']?',
+    )
+]
+_NAME_RE = re.compile(r'\w+')
+
+# Dependency and VCS directories the raw SQL scan prunes from its walk
+_RAW_SQL_SKIP_DIRS = frozenset({'node_modules', 'venv', '.venv', '__pycache__', '.git'})
+
+
+def _line_starts(content) -> List[int]:
+    """Offset of the first character (or byte) of every line; bisect_right(starts, offset) is the offset's 1-based line"""
+    newline = '\n' if isinstance(content, str) else b'\n'
+    starts = [0]
+    pos = content.find(newline)
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find(newline, pos + 1)
+    return starts
+
+
 # ============================================================
 # Code Schema Extractors (ORM Models → Tables/Columns)
 # ============================================================
@@ -46,11 +77,12 @@ class PrismaExtractor(CodeSchemaExtractor):
     def _parse_prisma_schema(self, content: str, file_path: str):
         # Find model definitions
         model_pattern = r'model\s+(\w+)\s*\{([^}]+)\}'
+        line_starts = _line_starts(content)
 
         for match in re.finditer(model_pattern, content, re.DOTALL):
             model_name = match.group(1)
             model_body = match.group(2)
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = bisect_right(line_starts, match.start())
 
             # Extract @@map for actual table name
             map_match = re.search(r'@@map\(["\'](\w+)["\']\)', model_body)
@@ -137,7 +169,7 @@ class TypeORMExtractor(CodeSchemaExtractor):
 
         class_name = class_match.group(1)
         table_name = entity_match.group(1) if entity_match and entity_match.group(1) else self._to_snake_case(class_name)
-        line_num = content[:class_match.start()].count('\n') + 1
+        line_num = content.count('\n', 0, class_match.start()) + 1
 
         # Find columns with @Column decorator
         columns = []
@@ -201,11 +233,12 @@ class DjangoExtractor(CodeSchemaExtractor):
     def _parse_django_models(self, content: str, file_path: str):
         # Find class definitions that inherit from models.Model
         class_pattern = r'class\s+(\w+)\s*\(\s*(?:models\.Model|[\w.]+)\s*\)\s*:'
+        line_starts = _line_starts(content)
 
         for class_match in re.finditer(class_pattern, content):
             class_name = class_match.group(1)
             class_start = class_match.end()
-            line_num = content[:class_match.start()].count('\n') + 1
+            line_num = bisect_right(line_starts, class_match.start())
 
             # Find next class or end of file
             next_class = re.search(r'\nclass\s+\w+', content[class_start:])
@@ -293,11 +326,12 @@ class SQLAlchemyExtractor(CodeSchemaExtractor):
     def _parse_sqlalchemy_models(self, content: str, file_path: str):
         # Find class definitions with __tablename__
         class_pattern = r'class\s+(\w+)\s*\([^)]+\)\s*:'
+        line_starts = _line_starts(content)
 
         for class_match in re.finditer(class_pattern, content):
             class_name = class_match.group(1)
             class_start = class_match.end()
-            line_num = content[:class_match.start()].count('\n') + 1
+            line_num = bisect_right(line_starts, class_match.start())
 
             # Find class body (until next class or dedent)
             next_class = re.search(r'\nclass\s+\w+', content[class_start:])
@@ -344,32 +378,40 @@ class RawSQLExtractor(CodeSchemaExtractor):
     def extract(self) -> Dict[str, Dict]:
         extensions = ['.js', '.ts', '.py', '.rb', '.go', '.java', '.php']
 
+        # One walk for every extension, pruning skipped directories instead of descending into them;
+        # files are still visited extension by extension, so the first file naming a table is unchanged
+        files_by_ext = {ext: [] for ext in extensions}
+        for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in _RAW_SQL_SKIP_DIRS]
+            for name in files:
+                bucket = files_by_ext.get(os.path.splitext(name)[1])
+                if bucket is not None:
+                    bucket.append(Path(root, name))
+
         for ext in extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                if any(skip in str(file_path) for skip in ['node_modules', 'venv', '__pycache__', '.git']):
-                    continue
+            for file_path in files_by_ext[ext]:
                 try:
-                    content = file_path.read_text()
+                    content = file_path.read_bytes()
                     self._extract_sql_references(content, str(file_path))
                 except Exception:
                     pass
 
         return self.tables
 
-    def _extract_sql_references(self, content: str, file_path: str):
+    def _extract_sql_references(self, content: bytes, file_path: str):
         # Find SQL statements in strings
-        sql_patterns = [
-            r'SELECT\s+.+?\s+FROM\s+[`"\']?(\w+)[`"\']?',
-            r'INSERT\s+INTO\s+[`"\']?(\w+)[`"\']?',
-            r'UPDATE\s+[`"\']?(\w+)[`"\']?',
-            r'DELETE\s+FROM\s+[`"\']?(\w+)[`"\']?',
-            r'JOIN\s+[`"\']?(\w+)[`"\']?',
-        ]
-
-        for pattern in sql_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                table_name = match.group(1).lower()
-                line_num = content[:match.start()].count('\n') + 1
+        line_starts = _line_starts(content)
+
+        for pattern in _RAW_SQL_PATTERNS:
+            for match in pattern.finditer(content):
+                try:
+                    name = _NAME_RE.match(match.group(1).decode())
+                except UnicodeDecodeError:
+                    continue  # Not UTF-8 text; no name to report
+                if name is None:
+                    continue
+                table_name = name.group(0).lower()
+                line_num = bisect_right(line_starts, match.start())
 
                 if table_name not in self.tables:
                     self.tables[table_name] = {
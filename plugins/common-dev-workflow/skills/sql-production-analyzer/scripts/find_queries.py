@@ -7,8 +7,20 @@ Supports multiple languages and ORMs.
 import re
 import os
 import json
+import mmap
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+# orjson serializes large reports several times faster than json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # SQL keywords that indicate a query
 SQL_KEYWORDS = [
@@ -98,9 +110,205 @@ ORM_PATTERNS = {
     ],
 }
 
+# The patterns are compiled once at import instead of per file, per pattern or per query. Sources are
+# scanned as raw bytes: every pattern is ASCII, so only matched queries and their context are decoded
+# SQL in strings (single/double/template quotes) is found keyword first, see _quoted_sql. Keywords
+# are matched case-sensitively on an uppercased copy of the file: IGNORECASE folded every byte the
+# search stepped over, and bytes patterns only fold ASCII, which translate does in one C pass
+_SQL_KEYWORD_RE = re.compile('|'.join(SQL_KEYWORDS).encode())
+_UPPERCASE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_QUOTE_RE = re.compile(rb'["\`\']')
+_ORM_REGEXES = [
+    (orm, [re.compile(pattern.encode()) for pattern in patterns]) for orm, patterns in ORM_PATTERNS.items()
+]
+
+
+def _method_patterns() -> Dict[re.Pattern, List[bytes]]:
+    """The '.method' patterns, \\.(?:name|...), with their method names in alternation order"""
+    method_patterns = {}
+    for _, patterns in _ORM_REGEXES:
+        for pattern in patterns:
+            names = re.fullmatch(rb'\\\.\(\?:([\w|]+)\)', pattern.pattern)
+            if names:
+                method_patterns[pattern] = names.group(1).split(b'|')
+    return method_patterns
+
+
+# Eight ORMs list '.method' patterns, overlapping on .find, .update, .where and the like. Instead of
+# each scanning the file, one scan finds every call whose name starts with any of their methods; a
+# pattern matches there with the first of its methods the name starts with, so which patterns match,
+# and what, follows from the name alone
+_METHOD_PATTERNS = _method_patterns()
+_METHOD_CALL_RE = re.compile(
+    rb'\.(?:' + b'|'.join(sorted({name for names in _METHOD_PATTERNS.values() for name in names})) + rb')\w*'
+)
+# The matching patterns, and the length each matches, per call name seen so far
+_METHOD_PLANS = {}
+
+# Bytes of a matched query decoded for the report: the 200 characters kept, however wide, and a split
+# character at the cut all fit, so a match spanning most of a file is never decoded whole
+_QUERY_DECODE_BYTES = 1024
+
+# Line breaks of a mapped file, for _line_starts
+_NEWLINE_RE = re.compile(b'\n')
+
+# String interpolation or concatenation around a query, as one alternation so the context is searched
+# once; run on decoded context lines
+_INJECTION_RE = re.compile(
+    r'\$\{'  # JavaScript template literal
+    r'|%s'  # Python old-style formatting
+    r'|\{.*?\}'  # Python f-string or .format()
+    r'|\+.*?["\']'  # String concatenation
+)
+
+# Dependency, build and VCS directories, pruned from the walk instead of filtered afterwards
+_SKIP_DIRS = frozenset({'node_modules', 'venv', '.venv', '__pycache__', '.git', 'dist', 'build'})
+
+# Minified bundles and generated one-liners (first line longer than this) only yield noise, and a
+# single bundle can outweigh the rest of the scan; files with a NUL byte in their head are binary
+_MINIFIED_LINE_BYTES = 4096
+_BINARY_PROBE_BYTES = 8192
+
+# Per-file results from earlier runs, relative to the project root; bump the version whenever
+# a change to the patterns or the query dicts would make cached results differ from a fresh scan
+_CACHE_FILE = Path('.sql-analyzer-cache') / 'find_queries.json'
+_CACHE_VERSION = 3
+
+# Below this many files, process-pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+
+@contextmanager
+def _mapped(path: Path):
+    """Map a file read-only while the block runs; empty files come back as b'' since mmap rejects them"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
+
+
+def _line_starts(content: bytes) -> List[int]:
+    """Offset of the first byte of every line; bisect_right(starts, offset) is the offset's 1-based line"""
+    # Match.end of each newline is the next line's start; mapping it over finditer keeps the whole
+    # scan in C, where a find() per newline ran a Python loop iteration for every line
+    starts = [0]
+    starts.extend(map(re.Match.end, _NEWLINE_RE.finditer(content)))
+    return starts
+
+
+def _context_lines(content: bytes, line_starts: List[int], first: int, stop: int) -> List[str]:
+    """Lines first to stop - 1 (0-based, clipped to the file), decoded on demand; no other line ever is"""
+    lines = []
+    for index in range(max(0, first), min(len(line_starts), stop)):
+        end = line_starts[index + 1] - 1 if index + 1 < len(line_starts) else len(content)
+        lines.append(content[line_starts[index]:end].removesuffix(b'\r').decode('utf-8', 'replace'))
+    return lines
+
+
+def _is_minified_or_binary(content: bytes) -> bool:
+    """Whether a file is binary or minified, judged from its head without scanning the rest"""
+    if content.find(b'\0', 0, _BINARY_PROBE_BYTES) != -1:
+        return True
+    return len(content) > _MINIFIED_LINE_BYTES and content.find(b'\n', 0, _MINIFIED_LINE_BYTES) == -1
+
+
+def _method_calls(content: bytes) -> Dict[re.Pattern, List[Tuple[int, bytes]]]:
+    """(start, text) of every match of each '.method' pattern, from a single scan of content"""
+    calls = {pattern: [] for pattern in _METHOD_PATTERNS}
+    for match in _METHOD_CALL_RE.finditer(content):
+        call = match.group(0)
+        plan = _METHOD_PLANS.get(call)
+        if plan is None:
+            plan = _METHOD_PLANS[call] = []
+            for pattern, names in _METHOD_PATTERNS.items():
+                name = next((name for name in names if call.startswith(name, 1)), None)
+                if name is not None:
+                    plan.append((pattern, len(name) + 1))
+        start = match.start()
+        for pattern, length in plan:
+            calls[pattern].append((start, call[:length]))
+    return calls
+
+
+def _quoted_sql(content: bytes):
+    """(start, query_start, query_end) of each match of ["`'](.*?(?:KEYWORD|...).*?)["`'] (IGNORECASE, DOTALL)"""
+    # From a quote, the query runs to the first quote after the next keyword. Jumping quote -> keyword
+    # -> quote is linear, where the regex's lazy scans backtracked from every quote in the file; once a
+    # keyword or a closing quote is missing, no later quote can start a match either
+    upper = content[:].translate(_UPPERCASE)  # Same offsets as content
+    pos = 0
+    while True:
+        quote = _QUOTE_RE.search(upper, pos)
+        if quote is None:
+            return
+        keyword = _SQL_KEYWORD_RE.search(upper, quote.end())
+        if keyword is None:
+            return
+        close = _QUOTE_RE.search(upper, keyword.end())
+        if close is None:
+            return
+        yield quote.start(), quote.end(), close.start()
+        pos = close.end()
+
+
+def _find_in_file(file_path: Path, project_root: Path) -> List[Dict]:
+    """Queries in one file; module-level so ProcessPoolExecutor workers can pickle it"""
+    finder = QueryFinder(str(project_root))
+    finder.analyze_file(file_path)
+    return finder.queries
+
+
+class _QueryCache:
+    """Queries found per file on earlier runs, reused while the file's mtime and size are unchanged"""
+    
+    def __init__(self, path: Path, project_root: Path):
+        self.path = path
+        self.project_root = project_root
+        self.entries = {}
+        # Only files seen on this run are written back, so deleted files drop out
+        self.fresh = {}
+        try:
+            data = json.loads(path.read_bytes())
+            if data.get('version') == _CACHE_VERSION:
+                self.entries = data['files']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    
+    def _key_and_stamp(self, file_path: Path) -> Tuple[str, Optional[List[int]]]:
+        try:
+            st = file_path.stat()
+        except OSError:
+            return '', None
+        return str(file_path.relative_to(self.project_root)), [st.st_mtime_ns, st.st_size]
+    
+    def lookup(self, file_path: Path) -> Optional[List[Dict]]:
+        """Cached queries for an unchanged file, else None"""
+        key, stamp = self._key_and_stamp(file_path)
+        entry = self.entries.get(key)
+        if stamp is None or entry is None or entry[0] != stamp:
+            return None
+        self.fresh[key] = entry
+        return entry[1]
+    
+    def store(self, file_path: Path, queries: List[Dict]):
+        key, stamp = self._key_and_stamp(file_path)
+        if stamp is not None:
+            self.fresh[key] = [stamp, queries]
+    
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({'version': _CACHE_VERSION, 'files': self.fresh}))
+        except OSError:
+            pass  # read-only checkout: the next run simply scans again
+
+
 class QueryFinder:
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, use_cache: bool = False):
         self.project_path = Path(project_path)
+        self.use_cache = use_cache
         self.queries = []
         
     def scan_project(self, extensions: List[str] = None) -> List[Dict]:
@@ -108,103 +316,156 @@ class QueryFinder:
         if extensions is None:
             extensions = ['.js', '.ts', '.py', '.rb', '.go', '.java', '.php']
         
-        for ext in extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                # Skip node_modules, venv, etc.
-                if any(skip in str(file_path) for skip in ['node_modules', 'venv', '__pycache__', '.git', 'dist', 'build']):
-                    continue
-                
-                self.analyze_file(file_path)
+        files_by_ext = self.collect_source_files(extensions)
+        files = [file_path for ext in extensions for file_path in files_by_ext[ext]]
+        
+        # Unchanged files reuse the queries cached on an earlier run; only the rest are analyzed
+        cache = _QueryCache(self.project_path / _CACHE_FILE, self.project_path) if self.use_cache else None
+        per_file = [cache.lookup(file_path) if cache else None for file_path in files]
+        stale = [file_path for file_path, queries in zip(files, per_file) if queries is None]
         
+        # Files are analyzed independently, so larger projects fan out across processes
+        if len(stale) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                found = iter(list(executor.map(_find_in_file, stale, repeat(self.project_path), chunksize=32)))
+        else:
+            found = (_find_in_file(file_path, self.project_path) for file_path in stale)
+        
+        for file_path, queries in zip(files, per_file):
+            if queries is None:
+                queries = next(found)
+                if cache:
+                    cache.store(file_path, queries)
+            self.queries.extend(queries)
+        
+        if cache:
+            cache.save()
         return self.queries
     
+    def collect_source_files(self, extensions: List[str]) -> Dict[str, List[Path]]:
+        """Group files with the given extensions by extension in a single directory walk"""
+        files_by_ext = {ext: [] for ext in extensions}
+        for root, dirs, files in os.walk(self.project_path):
+            # Prune in place so skipped directories are never descended into
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for name in files:
+                bucket = files_by_ext.get(os.path.splitext(name)[1])
+                if bucket is not None:
+                    bucket.append(Path(root, name))
+        return files_by_ext
+    
     def analyze_file(self, file_path: Path):
         """Analyze a single file for queries"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-            
-            # Find raw SQL queries
-            self.find_raw_sql(file_path, content, lines)
-            
-            # Find ORM queries
-            self.find_orm_queries(file_path, content, lines)
+            with _mapped(file_path) as content:
+                if _is_minified_or_binary(content):
+                    return
+                source = str(file_path.relative_to(self.project_path))
+                line_starts = _line_starts(content)
+                
+                # Find raw SQL queries
+                self.find_raw_sql(source, content, line_starts)
+                
+                # Find ORM queries
+                self.find_orm_queries(source, content, line_starts)
             
         except Exception as e:
             print(f"Error analyzing {file_path}: {e}")
     
-    def find_raw_sql(self, file_path: Path, content: str, lines: List[str]):
-        """Find raw SQL queries in strings"""
-        # Pattern for SQL in strings (single/double/template quotes)
-        sql_pattern = r'["\`\'](.*?(?:' + '|'.join(SQL_KEYWORDS) + r').*?)["\`\']'
-        
-        for match in re.finditer(sql_pattern, content, re.IGNORECASE | re.DOTALL):
-            query_text = match.group(1)
+    def find_raw_sql(self, source: str, content: bytes, line_starts: List[int]):
+        """Find raw SQL queries in strings; source is the file's path relative to the project"""
+        for match_start, start, end in _quoted_sql(content):
+            query_text = content[start:min(end, start + _QUERY_DECODE_BYTES)].decode('utf-8', 'replace')
+            query_text = query_text.replace('\r\n', '\n')
             
             # Skip if it's just a keyword in a comment
             if len(query_text) < 10:
                 continue
             
             # Find line number
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = bisect_right(line_starts, match_start)
+            context = _context_lines(content, line_starts, line_num - 2, line_num + 2)
             
             # Check for SQL injection risk (string interpolation/concatenation)
-            has_interpolation = self.check_sql_injection_risk(query_text, lines, line_num)
+            has_interpolation = self.check_sql_injection_risk(query_text, context)
             
             self.queries.append({
                 'type': 'raw_sql',
-                'file': str(file_path.relative_to(self.project_path)),
+                'file': source,
                 'line': line_num,
                 'query': query_text[:200],  # Truncate long queries
                 'sql_injection_risk': has_interpolation,
-                'context': lines[max(0, line_num-2):min(len(lines), line_num+2)]
+                'context': context
             })
     
-    def find_orm_queries(self, file_path: Path, content: str, lines: List[str]):
-        """Find ORM method calls"""
-        for orm, patterns in ORM_PATTERNS.items():
+    def find_orm_queries(self, source: str, content: bytes, line_starts: List[int]):
+        """Find ORM method calls; source is the file's path relative to the project"""
+        # (start, text) per pattern: the '.method' patterns share one scan, and patterns drivers share
+        # (aiomysql and asyncpg both list pool.acquire) scan the file once
+        matches_by_pattern = _method_calls(content)
+        # Overlapping patterns (typeorm and sequelize .update, knex and peewee .select) report the
+        # same text on the same line once, under the first ORM listed that matches it
+        seen = set()
+        # Chained calls put several matches on one line (prisma.user.findMany(...).then); its context
+        # is sliced and decoded for the first of them only
+        contexts = {}
+        for orm, patterns in _ORM_REGEXES:
             for pattern in patterns:
-                for match in re.finditer(pattern, content):
-                    line_num = content[:match.start()].count('\n') + 1
+                matches = matches_by_pattern.get(pattern)
+                if matches is None:
+                    matches = matches_by_pattern[pattern] = [
+                        (match.start(), match.group(0)) for match in pattern.finditer(content)
+                    ]
+                for start, query in matches:
+                    line_num = bisect_right(line_starts, start)
+                    if (line_num, query) in seen:
+                        continue
+                    seen.add((line_num, query))
+                    context = contexts.get(line_num)
+                    if context is None:
+                        context = contexts[line_num] = _context_lines(content, line_starts, line_num - 1, line_num + 1)
                     
                     self.queries.append({
                         'type': f'orm_{orm}',
-                        'file': str(file_path.relative_to(self.project_path)),
+                        'file': source,
                         'line': line_num,
-                        'query': match.group(0),
-                        'context': lines[max(0, line_num-1):min(len(lines), line_num+1)]
+                        'query': query.decode('utf-8', 'replace'),
+                        'context': context
                     })
     
-    def check_sql_injection_risk(self, query: str, lines: List[str], line_num: int) -> bool:
+    def check_sql_injection_risk(self, query: str, context: List[str]) -> bool:
         """Check if query uses string interpolation (injection risk)"""
-        # Template literals with ${}, f-strings, string concatenation
-        injection_patterns = [
-            r'\$\{',  # JavaScript template literal
-            r'\%s',   # Python old-style formatting
-            r'\{.*?\}',  # Python f-string or .format()
-            r'\+.*?["\']',  # String concatenation
-        ]
-        
-        # Check the query and surrounding lines
-        context = '\n'.join(lines[max(0, line_num-2):min(len(lines), line_num+2)])
+        # Check the query's surrounding lines for template literals with ${}, f-strings, string concatenation
+        context = '\n'.join(context)
         
-        return any(re.search(pattern, context) for pattern in injection_patterns)
+        # Every alternative needs a '{', '+' or '%s'; most contexts have none and skip the regex
+        if '{' not in context and '+' not in context and '%s' not in context:
+            return False
+        return _INJECTION_RE.search(context) is not None
     
     def generate_report(self) -> str:
         """Generate a summary report"""
         total = len(self.queries)
-        raw_sql = len([q for q in self.queries if q['type'] == 'raw_sql'])
-        injection_risks = len([q for q in self.queries if q.get('sql_injection_risk')])
+        
+        # Type, injection-risk and per-file counts in one pass over the queries
+        by_type = Counter()
+        file_counts = Counter()
+        injection_risks = 0
+        for q in self.queries:
+            by_type[q['type']] += 1
+            file_counts[q['file']] += 1
+            if q.get('sql_injection_risk'):
+                injection_risks += 1
+        raw_sql = by_type['raw_sql']
         
         # Categorize by ORM framework
         js_orms = ['prisma', 'typeorm', 'sequelize', 'knex', 'drizzle']
         py_orms = ['sqlalchemy', 'django', 'peewee', 'tortoise', 'aiomysql', 'asyncpg', 'pymysql']
         other_orms = ['activerecord', 'gorm', 'jpa']
 
-        js_queries = len([q for q in self.queries if any(orm in q['type'] for orm in js_orms)])
-        py_queries = len([q for q in self.queries if any(orm in q['type'] for orm in py_orms)])
-        other_queries = len([q for q in self.queries if any(orm in q['type'] for orm in other_orms)])
+        js_queries = sum(n for t, n in by_type.items() if any(orm in t for orm in js_orms))
+        py_queries = sum(n for t, n in by_type.items() if any(orm in t for orm in py_orms))
+        other_queries = sum(n for t, n in by_type.items() if any(orm in t for orm in other_orms))
 
         report = f"""
 SQL Query Analysis Report
@@ -221,11 +482,6 @@ By ORM Framework:
 
 Files with most queries:
 """
-        # Group by file
-        file_counts = {}
-        for q in self.queries:
-            file_counts[q['file']] = file_counts.get(q['file'], 0) + 1
-        
         for file, count in sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
             report += f"  {file}: {count} queries\n"
         
@@ -236,19 +492,22 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python find_queries.py <project_path>")
+        print("Usage: python find_queries.py <project_path> [--no-cache]")
         sys.exit(1)
     
     project_path = sys.argv[1]
     
     print(f"Scanning {project_path} for database queries...")
-    finder = QueryFinder(project_path)
+    finder = QueryFinder(project_path, use_cache='--no-cache' not in sys.argv[2:])
     queries = finder.scan_project()
     
     # Save results
     output_file = 'queries_found.json'
-    with open(output_file, 'w') as f:
-        json.dump(queries, f, indent=2)
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(queries, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(queries, f, indent=2)
     
     print(finder.generate_report())
     print(f"\nDetailed results saved to {output_file}")
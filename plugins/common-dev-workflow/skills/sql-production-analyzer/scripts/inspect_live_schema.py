@@ -10,6 +10,12 @@ import sys
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+# orjson serializes large reports several times faster than json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DatabaseInspector:
     """Base class for database inspection"""
@@ -51,108 +57,112 @@ class PostgreSQLInspector(DatabaseInspector):
             conn.set_session(readonly=True)  # 🔒 Read-only mode
             cur = conn.cursor()
             
-            # Get tables
+            # Get tables, indexes, foreign keys, statistics and constraints in one round-trip:
+            # each catalog query is folded into a json_agg column of a single row, which
+            # psycopg2 decodes to a list of dicts (NULL when the query has no rows)
             cur.execute("""
-                SELECT table_name, 
-                       pg_size_pretty(pg_total_relation_size(quote_ident(table_name)::regclass)) as size
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                  AND table_type = 'BASE TABLE'
+                SELECT
+                    (SELECT json_agg(t) FROM (
+                        SELECT table_name,
+                               pg_size_pretty(pg_total_relation_size(quote_ident(table_name)::regclass)) as size
+                        FROM information_schema.tables
+                        WHERE table_schema = 'public'
+                          AND table_type = 'BASE TABLE'
+                    ) t),
+                    (SELECT json_agg(i ORDER BY i.tablename, i.indexname) FROM (
+                        SELECT
+                            t.tablename,
+                            i.indexname,
+                            array_agg(a.attname ORDER BY a.attnum) as columns,
+                            pg_size_pretty(pg_relation_size(i.indexname::regclass)) as size
+                        FROM pg_indexes i
+                        JOIN pg_class c ON c.relname = i.indexname
+                        JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0
+                        JOIN pg_tables t ON t.tablename = i.tablename
+                        WHERE t.schemaname = 'public'
+                        GROUP BY t.tablename, i.indexname
+                    ) i),
+                    (SELECT json_agg(f) FROM (
+                        SELECT
+                            tc.table_name,
+                            kcu.column_name,
+                            ccu.table_name AS foreign_table,
+                            ccu.column_name AS foreign_column
+                        FROM information_schema.table_constraints tc
+                        JOIN information_schema.key_column_usage kcu
+                            ON tc.constraint_name = kcu.constraint_name
+                            AND tc.table_schema = kcu.table_schema
+                        JOIN information_schema.constraint_column_usage ccu
+                            ON ccu.constraint_name = tc.constraint_name
+                            AND ccu.table_schema = tc.table_schema
+                        WHERE tc.constraint_type = 'FOREIGN KEY'
+                          AND tc.table_schema = 'public'
+                    ) f),
+                    (SELECT json_agg(s) FROM (
+                        SELECT
+                            relname as tablename,
+                            n_live_tup as row_count,
+                            n_dead_tup as dead_rows,
+                            last_vacuum,
+                            last_autovacuum
+                        FROM pg_stat_user_tables
+                        WHERE schemaname = 'public'
+                    ) s),
+                    (SELECT json_agg(c) FROM (
+                        SELECT
+                            tc.table_name,
+                            tc.constraint_name,
+                            tc.constraint_type
+                        FROM information_schema.table_constraints tc
+                        WHERE tc.table_schema = 'public'
+                          AND tc.constraint_type IN ('UNIQUE', 'PRIMARY KEY', 'CHECK')
+                    ) c)
             """)
-            tables = [{'name': row[0], 'size': row[1]} for row in cur.fetchall()]
+            table_rows, index_rows, fk_rows, stat_rows, constraint_rows = (
+                rows or [] for rows in cur.fetchone()
+            )
+
+            tables = [{'name': row['table_name'], 'size': row['size']} for row in table_rows]
             
-            # Get indexes
-            cur.execute("""
-                SELECT 
-                    t.tablename,
-                    i.indexname,
-                    array_agg(a.attname ORDER BY a.attnum) as columns,
-                    pg_size_pretty(pg_relation_size(i.indexname::regclass)) as size
-                FROM pg_indexes i
-                JOIN pg_class c ON c.relname = i.indexname
-                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0
-                JOIN pg_tables t ON t.tablename = i.tablename
-                WHERE t.schemaname = 'public'
-                GROUP BY t.tablename, i.indexname
-                ORDER BY t.tablename, i.indexname
-            """)
             indexes = {}
-            for row in cur.fetchall():
-                table = row[0]
+            for row in index_rows:
+                table = row['tablename']
                 if table not in indexes:
                     indexes[table] = []
                 indexes[table].append({
-                    'name': row[1],
-                    'columns': row[2],
-                    'size': row[3]
+                    'name': row['indexname'],
+                    'columns': row['columns'],
+                    'size': row['size']
                 })
             
-            # Get foreign keys
-            cur.execute("""
-                SELECT
-                    tc.table_name,
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table,
-                    ccu.column_name AS foreign_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                  AND tc.table_schema = 'public'
-            """)
             foreign_keys = {}
-            for row in cur.fetchall():
-                table = row[0]
+            for row in fk_rows:
+                table = row['table_name']
                 if table not in foreign_keys:
                     foreign_keys[table] = []
                 foreign_keys[table].append({
-                    'column': row[1],
-                    'references_table': row[2],
-                    'references_column': row[3]
+                    'column': row['column_name'],
+                    'references_table': row['foreign_table'],
+                    'references_column': row['foreign_column']
                 })
             
-            # Get table statistics
-            cur.execute("""
-                SELECT 
-                    tablename,
-                    n_live_tup as row_count,
-                    n_dead_tup as dead_rows,
-                    last_vacuum,
-                    last_autovacuum
-                FROM pg_stat_user_tables
-                WHERE schemaname = 'public'
-            """)
             stats = {}
-            for row in cur.fetchall():
-                stats[row[0]] = {
-                    'row_count': row[1],
-                    'dead_rows': row[2],
-                    'last_vacuum': str(row[3]) if row[3] else None,
-                    'last_autovacuum': str(row[4]) if row[4] else None
+            for row in stat_rows:
+                stats[row['tablename']] = {
+                    'row_count': row['row_count'],
+                    'dead_rows': row['dead_rows'],
+                    'last_vacuum': row['last_vacuum'],
+                    'last_autovacuum': row['last_autovacuum']
                 }
             
-            # Get constraints
-            cur.execute("""
-                SELECT
-                    tc.table_name,
-                    tc.constraint_name,
-                    tc.constraint_type
-                FROM information_schema.table_constraints tc
-                WHERE tc.table_schema = 'public'
-                  AND tc.constraint_type IN ('UNIQUE', 'PRIMARY KEY', 'CHECK')
-            """)
             constraints = {}
-            for row in cur.fetchall():
-                table = row[0]
+            for row in constraint_rows:
+                table = row['table_name']
                 if table not in constraints:
                     constraints[table] = []
                 constraints[table].append({
-                    'name': row[1],
-                    'type': row[2]
+                    'name': row['constraint_name'],
+                    'type': row['constraint_type']
                 })
             
             cur.close()
@@ -200,31 +210,31 @@ class MySQLInspector(DatabaseInspector):
             cursor.execute("SHOW TABLES")
             tables = [{'name': row[0]} for row in cursor.fetchall()]
             
-            # Get indexes and stats for each table
-            indexes = {}
-            stats = {}
+            # Get indexes of every table in one round-trip instead of a SHOW INDEX per table
+            cursor.execute("""
+                SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME
+                FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE()
+                ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+            """)
+            table_indexes = {table['name']: {} for table in tables}
+            for table_name, idx_name, column in cursor.fetchall():
+                table_indexes.setdefault(table_name, {}).setdefault(idx_name, []).append(column)
             
-            for table in tables:
-                table_name = table['name']
-                
-                # Get indexes
-                cursor.execute(f"SHOW INDEX FROM {table_name}")
-                table_indexes = {}
-                for row in cursor.fetchall():
-                    idx_name = row[2]
-                    if idx_name not in table_indexes:
-                        table_indexes[idx_name] = []
-                    table_indexes[idx_name].append(row[4])  # Column name
-                
-                indexes[table_name] = [
-                    {'name': name, 'columns': cols}
-                    for name, cols in table_indexes.items()
-                ]
-                
-                # Get table stats
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = cursor.fetchone()[0]
-                stats[table_name] = {'row_count': row_count}
+            indexes = {
+                table_name: [{'name': name, 'columns': cols} for name, cols in by_name.items()]
+                for table_name, by_name in table_indexes.items()
+            }
+            
+            # Get table stats: the TABLE_ROWS estimate, like n_live_tup for PostgreSQL, since a
+            # COUNT(*) per table scans every row of InnoDB tables (None for views)
+            cursor.execute("""
+                SELECT TABLE_NAME, TABLE_ROWS
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE()
+            """)
+            row_counts = dict(cursor.fetchall())
+            stats = {table['name']: {'row_count': row_counts.get(table['name'])} for table in tables}
             
             cursor.close()
             conn.close()
@@ -360,8 +370,12 @@ def main():
 
     # Save to file
     output_file = 'live_schema_inspection.json'
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(result, f, indent=2)
 
     # Print summary
     print(f"\n✅ Inspection complete!")
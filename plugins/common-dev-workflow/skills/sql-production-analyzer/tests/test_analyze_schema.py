@@ -0,0 +1,33 @@
+"""Tests for analyze_schema.py; run with python -m unittest discover from the skill directory."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from analyze_schema import SchemaAnalyzer  # noqa: E402
+
+_COLUMNS = ['id', 'user_id', 'userId', 'ownerID', 'org_id', 'uuid', 'UUID', 'paid', 'valid', 'void']
+
+
+class ForeignKeyIndexTest(unittest.TestCase):
+    def _flagged(self):
+        analyzer = SchemaAnalyzer('.')
+        analyzer.tables['orders'] = {'columns': [{'name': name} for name in _COLUMNS], 'source': 'schema.sql'}
+        analyzer.indexes['orders'].append({'columns': ['id', 'org_id']})
+        analyzer.check_foreign_keys()
+        return [issue.column for issue in analyzer.issues if issue.type == 'missing_fk_index']
+
+    def test_unindexed_key_columns_are_flagged(self):
+        self.assertEqual(self._flagged(), ['user_id', 'userId', 'ownerID'])
+
+    def test_words_ending_in_id_are_not_flagged(self):
+        flagged = self._flagged()
+
+        for name in ('uuid', 'UUID', 'paid', 'valid', 'void'):
+            self.assertNotIn(name, flagged)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for find_queries.py; run with python -m unittest discover from the skill directory."""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from find_queries import QueryFinder  # noqa: E402
+
+# Latin-1 source: the \xe9 bytes are not valid UTF-8
+_LATIN1_JS = (
+    b'// caf\xe9 r\xe9sum\xe9\n'
+    b'const users = await prisma.user.findMany({ take: 10 }); // Ren\xe9\n'
+    b'const rows = await db.query("SELECT * FROM users WHERE city = \'Montr\xe9al\'");\n'
+)
+
+
+class NonUtf8SourceTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        (self.project / 'users.js').write_bytes(_LATIN1_JS)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_queries_in_latin1_file_are_reported(self):
+        finder = QueryFinder(str(self.project))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            queries = finder.scan_project(['.js'])
+
+        self.assertNotIn('Error analyzing', output.getvalue())
+        orm = [q for q in queries if q['type'] == 'orm_prisma']
+        raw = [q for q in queries if q['type'] == 'raw_sql']
+        self.assertEqual([(q['line'], q['query']) for q in orm], [(2, 'prisma.user.findMany')])
+        self.assertIn('Ren\ufffd', orm[0]['context'][0])
+        self.assertEqual([q['line'] for q in raw], [3])
+        self.assertIn('Montr\ufffdal', raw[0]['context'][1])
+
+
+if __name__ == '__main__':
+    unittest.main()